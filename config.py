@@ -1,6 +1,6 @@
 """Configuration and constants for Sitzplatz-Manager application."""
 
-from typing import Dict
+from typing import Dict, Tuple
 
 # ============================================================================
 # Colors (Dittmann Brand Colors)
@@ -57,6 +57,9 @@ WEEKDAY_ABBR: Dict[str, str] = {
 # Reverse mapping
 WEEKDAY_FROM_GERMAN: Dict[str, str] = {v: k for k, v in WEEKDAYS.items()}
 
+# Iteration order of the week (Monday first)
+WEEKDAY_ORDER: Tuple[str, ...] = tuple(WEEKDAYS)
+
 # ============================================================================
 # German UI Text
 # ============================================================================
@@ -10,6 +10,7 @@ import logging
 
 from config import DATA_FILE, LOCK_FILE, BACKUP_DIR
 from models import Room, Seat, Student, Assignment
+from data.json_codec import dumps, loads
 
 logger = logging.getLogger(__name__)
 
@@ -57,8 +58,7 @@ class DataManager:
                 logger.info(f"Data file not found at {file_to_load}, creating new data")
                 return self._create_empty_data()
 
-            with open(file_to_load, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = loads(file_to_load.read_bytes())
 
             logger.info(f"Loaded data from {file_to_load}")
             
@@ -99,8 +99,7 @@ class DataManager:
 
             # Write to temporary file first (atomic write)
             temp_file = file_to_save.with_suffix('.tmp')
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            temp_file.write_bytes(dumps(data))
 
             # Move temp file to actual file (atomic on most systems)
             temp_file.replace(file_to_save)
@@ -260,8 +259,7 @@ class DataManager:
             json.JSONDecodeError: If backup file is corrupted
         """
         try:
-            with open(backup_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = loads(Path(backup_file).read_bytes())
             logger.info(f"Restored data from backup: {backup_file}")
             return data
         except Exception as e:
@@ -0,0 +1,41 @@
+"""JSON encoding shared by DataManager and LockManager, using orjson if installed."""
+
+import json
+from typing import Dict, Any
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps(data: Dict[str, Any]) -> bytes:
+    """Serialize data to indented UTF-8 JSON, using orjson if installed.
+
+    Args:
+        data: Data dictionary to serialize
+
+    Returns:
+        JSON document as bytes
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def loads(raw: bytes) -> Dict[str, Any]:
+    """Parse a UTF-8 JSON document, using orjson if installed.
+
+    Args:
+        raw: JSON document as bytes
+
+    Returns:
+        Parsed data dictionary
+
+    Raises:
+        json.JSONDecodeError: If JSON is malformed (orjson's error subclasses it)
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
@@ -1,6 +1,5 @@
 """LockManager handles file locking for multi-user support."""
 
-import json
 import os
 import socket
 import time
@@ -9,7 +8,14 @@ from pathlib import Path
 from typing import Dict, Optional, Tuple
 import logging
 
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
 from config import LOCK_FILE, LOCK_TIMEOUT_SECONDS
+from data.json_codec import dumps, loads
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +28,13 @@ class LockManager:
     - Stale lock detection (timeout)
     - Lock status queries
     - Multi-user coordination
+
+    On POSIX systems the lock holder additionally keeps an fcntl.flock on the
+    lock file. The kernel drops it when the process dies, so a crashed
+    instance on the same machine is detected immediately instead of after
+    the timeout. Locks written from other machines (network drives) are
+    still judged by the JSON timestamp, since flock does not reliably
+    propagate across hosts.
     """
 
     def __init__(self, data_dir: Optional[str] = None):
@@ -34,6 +47,7 @@ class LockManager:
         self.lock_file = self.data_dir / LOCK_FILE
         self.timeout_seconds = LOCK_TIMEOUT_SECONDS
         self._lock_info: Optional[Dict] = None
+        self._fd: Optional[int] = None
 
     def acquire_lock(self, user: str) -> Tuple[bool, Optional[Dict]]:
         """Try to acquire a file lock.
@@ -47,32 +61,9 @@ class LockManager:
             - If another user holds lock: (False, lock_info)
         """
         try:
-            # If lock exists, check if it's stale
-            if self.lock_file.exists():
-                with open(self.lock_file, 'r', encoding='utf-8') as f:
-                    existing_lock = json.load(f)
-
-                # Check if lock is stale
-                if self._is_lock_stale(existing_lock):
-                    logger.info(f"Removing stale lock from {existing_lock.get('user')}")
-                    self.lock_file.unlink()
-                else:
-                    logger.warning(f"Lock held by {existing_lock.get('user')} on {existing_lock.get('hostname')}")
-                    return False, existing_lock
-
-            # Create new lock
-            lock_data = self._create_lock_data(user)
-
-            # Ensure directory exists
-            self.data_dir.mkdir(parents=True, exist_ok=True)
-
-            # Write lock file
-            with open(self.lock_file, 'w', encoding='utf-8') as f:
-                json.dump(lock_data, f, indent=2)
-
-            self._lock_info = lock_data
-            logger.info(f"Lock acquired by {user}")
-            return True, None
+            if FCNTL_AVAILABLE:
+                return self._acquire_os_lock(user)
+            return self._acquire_exclusive_create(user)
 
         except Exception as e:
             logger.error(f"Error acquiring lock: {e}")
@@ -85,11 +76,16 @@ class LockManager:
             True if lock was released, False if no lock to release
         """
         try:
-            if self.lock_file.exists():
-                self.lock_file.unlink()
-                self._lock_info = None
-                logger.info("Lock released")
-                return True
+            if self._fd is not None:
+                return self._release_os_lock()
+
+            # Unlink directly instead of checking exists() first: one syscall
+            self.lock_file.unlink()
+            self._lock_info = None
+            logger.info("Lock released")
+            return True
+
+        except FileNotFoundError:
             return False
 
         except Exception as e:
@@ -103,19 +99,18 @@ class LockManager:
             True if locked by another user, False if unlocked or own lock
         """
         try:
-            if not self.lock_file.exists():
-                return False
-
-            with open(self.lock_file, 'r', encoding='utf-8') as f:
-                lock_data = json.load(f)
+            lock_data = loads(self.lock_file.read_bytes())
 
-            # If lock is stale, it's effectively not locked
-            if self._is_lock_stale(lock_data):
+            # If lock is stale or its holder died, it's effectively not locked
+            if self._is_lock_abandoned(lock_data):
                 return False
 
             # If this is our own lock, it's not locked (from perspective of another process)
             return lock_data != self._lock_info
 
+        except FileNotFoundError:
+            return False
+
         except Exception as e:
             logger.warning(f"Error checking lock status: {e}")
             return False
@@ -127,35 +122,33 @@ class LockManager:
             Dictionary with lock information if locked, None otherwise
         """
         try:
-            if not self.lock_file.exists():
-                return None
+            lock_data = loads(self.lock_file.read_bytes())
 
-            with open(self.lock_file, 'r', encoding='utf-8') as f:
-                lock_data = json.load(f)
-
-            if self._is_lock_stale(lock_data):
+            if self._is_lock_abandoned(lock_data):
                 return None
 
             return lock_data
 
+        except FileNotFoundError:
+            return None
+
         except Exception as e:
             logger.warning(f"Error reading lock info: {e}")
             return None
 
     def is_stale_lock(self) -> bool:
-        """Check if current lock is stale (older than timeout).
+        """Check if current lock is stale (timed out, or its holder on this machine died).
 
         Returns:
             True if lock exists and is stale, False otherwise
         """
         try:
-            if not self.lock_file.exists():
-                return False
+            lock_data = loads(self.lock_file.read_bytes())
 
-            with open(self.lock_file, 'r', encoding='utf-8') as f:
-                lock_data = json.load(f)
+            return self._is_lock_abandoned(lock_data)
 
-            return self._is_lock_stale(lock_data)
+        except FileNotFoundError:
+            return False
 
         except Exception as e:
             logger.warning(f"Error checking lock staleness: {e}")
@@ -177,8 +170,10 @@ class LockManager:
             # Update timestamp
             self._lock_info["timestamp"] = datetime.utcnow().isoformat() + "Z"
 
-            with open(self.lock_file, 'w', encoding='utf-8') as f:
-                json.dump(self._lock_info, f, indent=2)
+            if self._fd is not None:
+                self._write_lock_fd(self._fd, dumps(self._lock_info))
+            else:
+                self.lock_file.write_bytes(dumps(self._lock_info))
 
             return True
 
@@ -190,6 +185,219 @@ class LockManager:
     # Private helper methods
     # ========================================================================
 
+    def _acquire_os_lock(self, user: str) -> Tuple[bool, Optional[Dict]]:
+        """Acquire the lock using fcntl.flock plus JSON metadata (POSIX only).
+
+        Args:
+            user: Username or identifier
+
+        Returns:
+            Tuple of (success, existing_lock_info_if_failed)
+        """
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+
+        # Serialize up front so the critical section is just flock + pwrite
+        lock_data = self._create_lock_data(user)
+        payload = dumps(lock_data)
+
+        # A few attempts cover the lock file being replaced between our
+        # open() and flock() by another instance releasing or taking over,
+        # and flocks that are only held for an instant
+        contended_lock = None
+        for _ in range(5):
+            fd = os.open(self.lock_file, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                existing_lock = self._read_lock_fd(fd)
+                os.close(fd)
+                if existing_lock and existing_lock.get("hostname") != socket.gethostname():
+                    # Only the timestamp speaks for remote holders
+                    if self._is_lock_stale(existing_lock):
+                        logger.info(f"Removing stale lock from {existing_lock.get('user')}")
+                        self._unlink_lock_file()
+                        continue
+                elif not (existing_lock and isinstance(existing_lock.get("pid"), int)
+                          and self._process_exists(existing_lock["pid"])):
+                    # Held on this machine but the recorded holder is gone (or
+                    # not written yet): another instance is mid-acquire, or an
+                    # is_locked() probe holds LOCK_SH for an instant. Never
+                    # take it over; wait briefly and look again.
+                    contended_lock = existing_lock or {}
+                    time.sleep(0.05)
+                    continue
+                logger.warning(f"Lock held by {existing_lock.get('user')} on {existing_lock.get('hostname')}")
+                return False, existing_lock
+
+            if not self._fd_matches_lock_file(fd):
+                os.close(fd)
+                continue
+
+            existing_lock = self._read_lock_fd(fd)
+            if (existing_lock
+                    and existing_lock.get("hostname") != socket.gethostname()
+                    and not self._is_lock_stale(existing_lock)):
+                # Held from another machine, whose flock we cannot see
+                os.close(fd)
+                logger.warning(f"Lock held by {existing_lock.get('user')} on {existing_lock.get('hostname')}")
+                return False, existing_lock
+
+            if existing_lock:
+                logger.info(f"Taking over abandoned lock from {existing_lock.get('user')}")
+
+            self._write_lock_fd(fd, payload)
+            self._fd = fd
+            self._lock_info = lock_data
+            logger.info(f"Lock acquired by {user}")
+            return True, None
+
+        if contended_lock is not None:
+            logger.warning(f"Lock held by {contended_lock.get('user')} on {contended_lock.get('hostname')}")
+            return False, contended_lock
+        raise OSError(f"Lock file {self.lock_file} kept changing while acquiring lock")
+
+    def _acquire_exclusive_create(self, user: str) -> Tuple[bool, Optional[Dict]]:
+        """Acquire the lock by atomically creating the lock file (no fcntl).
+
+        O_CREAT | O_EXCL lets exactly one instance create the file, so two
+        instances can no longer both see "no lock" and then both write one.
+
+        Args:
+            user: Username or identifier
+
+        Returns:
+            Tuple of (success, existing_lock_info_if_failed)
+        """
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+
+        lock_data = self._create_lock_data(user)
+        payload = dumps(lock_data)
+
+        # A few attempts cover a stale lock being removed (by us or another
+        # instance) between our failed create and the retry
+        for _ in range(3):
+            try:
+                fd = os.open(self.lock_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+            except FileExistsError:
+                try:
+                    existing_lock = loads(self.lock_file.read_bytes())
+                except FileNotFoundError:
+                    continue
+
+                if self._is_lock_stale(existing_lock):
+                    logger.info(f"Removing stale lock from {existing_lock.get('user')}")
+                    self._unlink_lock_file()
+                    continue
+
+                logger.warning(f"Lock held by {existing_lock.get('user')} on {existing_lock.get('hostname')}")
+                return False, existing_lock
+
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+
+            self._lock_info = lock_data
+            logger.info(f"Lock acquired by {user}")
+            return True, None
+
+        raise OSError(f"Lock file {self.lock_file} kept changing while acquiring lock")
+
+    def _release_os_lock(self) -> bool:
+        """Remove the lock file and drop the flock held on it.
+
+        Returns:
+            True if our lock file was removed, False if it had already been
+            replaced (e.g. taken over as stale by another instance)
+        """
+        fd = self._fd
+        self._fd = None
+        self._lock_info = None
+        try:
+            # Only remove the file if it is still ours
+            owned = self._fd_matches_lock_file(fd)
+            if owned:
+                self._unlink_lock_file()
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+        if owned:
+            logger.info("Lock released")
+        return owned
+
+    def _fd_matches_lock_file(self, fd: int) -> bool:
+        """Check that an open descriptor still refers to the lock file on disk.
+
+        Args:
+            fd: Open file descriptor of the lock file
+
+        Returns:
+            True if the lock file path points at the same inode as fd
+        """
+        try:
+            path_stat = os.stat(self.lock_file)
+        except FileNotFoundError:
+            return False
+        fd_stat = os.fstat(fd)
+        return (fd_stat.st_dev, fd_stat.st_ino) == (path_stat.st_dev, path_stat.st_ino)
+
+    def _unlink_lock_file(self) -> None:
+        """Remove the lock file, ignoring it if already gone."""
+        try:
+            self.lock_file.unlink()
+        except FileNotFoundError:
+            pass
+
+    def _read_lock_fd(self, fd: int) -> Optional[Dict]:
+        """Read lock data through an open descriptor.
+
+        Args:
+            fd: Open file descriptor of the lock file
+
+        Returns:
+            Lock information dictionary, or None if empty or unreadable
+        """
+        try:
+            raw = os.pread(fd, os.fstat(fd).st_size, 0)
+            return loads(raw) if raw else None
+        except ValueError:
+            return None
+
+    def _write_lock_fd(self, fd: int, payload: bytes) -> None:
+        """Overwrite the lock file contents through an open descriptor.
+
+        Args:
+            fd: Open file descriptor of the lock file
+            payload: Serialized lock information
+        """
+        os.pwrite(fd, payload, 0)
+        os.ftruncate(fd, len(payload))
+
+    def _is_lock_abandoned(self, lock_data: Dict) -> bool:
+        """Check if a lock is stale or its holder on this machine has died.
+
+        Args:
+            lock_data: Lock information dictionary
+
+        Returns:
+            True if the lock no longer protects anything, False otherwise
+        """
+        if not FCNTL_AVAILABLE or lock_data.get("hostname") != socket.gethostname():
+            return self._is_lock_stale(lock_data)
+
+        # Same machine: the holder keeps a flock for as long as it lives, so
+        # only the flock decides, however old the timestamp is
+        try:
+            fd = os.open(self.lock_file, os.O_RDONLY)
+        except FileNotFoundError:
+            return True
+        try:
+            fcntl.flock(fd, fcntl.LOCK_SH | fcntl.LOCK_NB)
+            return True
+        except BlockingIOError:
+            return False
+        finally:
+            os.close(fd)
+
     def _create_lock_data(self, user: str) -> Dict:
         """Create lock data structure.
 
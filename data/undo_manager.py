@@ -1,8 +1,10 @@
 """UndoManager handles undo/redo state management."""
 
+import copy
 import time
+from collections import deque
 from dataclasses import dataclass
-from typing import Dict, Any, Optional, List
+from typing import Deque, Dict, Any, Optional, List
 import logging
 
 from config import UNDO_STACK_MAX
@@ -21,6 +23,9 @@ class StateSnapshot:
         assignments: All assignments for all weeks
         metadata: Last modified user, etc
     """
+    # No per-instance __dict__; dataclass(slots=True) would need Python 3.10
+    __slots__ = ("timestamp", "floorplan", "students", "assignments", "metadata")
+
     timestamp: float
     floorplan: Dict[str, Any]
     students: List[Dict[str, Any]]
@@ -56,8 +61,9 @@ class UndoManager:
         Args:
             max_states: Maximum number of states to keep in memory
         """
-        self.undo_stack: List[StateSnapshot] = []
-        self.redo_stack: List[StateSnapshot] = []
+        # deque(maxlen=...) drops the oldest state in O(1) when full
+        self.undo_stack: Deque[StateSnapshot] = deque(maxlen=max_states)
+        self.redo_stack: Deque[StateSnapshot] = deque(maxlen=max_states)
         self.max_states = max_states
         logger.debug(f"UndoManager initialized with max_states={max_states}")
 
@@ -67,27 +73,28 @@ class UndoManager:
         Clears redo stack when new action is performed.
         Removes oldest state if max capacity is reached.
 
+        The snapshot owns its data, so the caller may keep mutating state in
+        place. Sections unchanged since the previous snapshot are shared
+        with it instead of copied again.
+
         Args:
             state: Dictionary with complete application state
         """
         try:
+            previous = self.undo_stack[-1].to_dict() if self.undo_stack else {}
             snapshot = StateSnapshot(
                 timestamp=time.time(),
-                floorplan=state.get("floorplan", {}),
-                students=state.get("students", []),
-                assignments=state.get("assignments", {}),
-                metadata=state.get("metadata", {})
+                floorplan=self._share_or_copy(state.get("floorplan", {}), previous.get("floorplan")),
+                students=self._share_or_copy(state.get("students", []), previous.get("students")),
+                assignments=self._share_or_copy(state.get("assignments", {}), previous.get("assignments")),
+                metadata=self._share_or_copy(state.get("metadata", {}), previous.get("metadata"))
             )
 
+            if len(self.undo_stack) == self.max_states:
+                logger.debug("Removed oldest state from undo stack")
             self.undo_stack.append(snapshot)
 
-            # Keep only max_states most recent states
-            if len(self.undo_stack) > self.max_states:
-                removed = self.undo_stack.pop(0)
-                logger.debug(f"Removed oldest state from undo stack")
-
             # Clear redo stack when new action is performed
-            redo_count = len(self.redo_stack)
             self.redo_stack.clear()
 
             logger.debug(f"Pushed state. Undo: {len(self.undo_stack)}, Redo: {len(self.redo_stack)}")
@@ -100,7 +107,7 @@ class UndoManager:
         """Move current state to redo and return previous state.
 
         Returns:
-            Previous state dictionary if available, None otherwise
+            Copy of the previous state dictionary if available, None otherwise
         """
         try:
             if not self.undo_stack:
@@ -115,7 +122,7 @@ class UndoManager:
             if self.undo_stack:
                 previous = self.undo_stack[-1]
                 logger.debug(f"Undo performed. Undo: {len(self.undo_stack)}, Redo: {len(self.redo_stack)}")
-                return previous.to_dict()
+                return copy.deepcopy(previous.to_dict())
 
             logger.debug("No previous state available")
             return None
@@ -128,7 +135,7 @@ class UndoManager:
         """Move state from redo back to undo stack.
 
         Returns:
-            Next state dictionary if available, None otherwise
+            Copy of the next state dictionary if available, None otherwise
         """
         try:
             if not self.redo_stack:
@@ -140,7 +147,7 @@ class UndoManager:
             self.undo_stack.append(state)
 
             logger.debug(f"Redo performed. Undo: {len(self.undo_stack)}, Redo: {len(self.redo_stack)}")
-            return state.to_dict()
+            return copy.deepcopy(state.to_dict())
 
         except Exception as e:
             logger.error(f"Error during redo: {e}")
@@ -203,3 +210,18 @@ class UndoManager:
             "max_states": self.max_states,
             "current_usage": f"{len(self.undo_stack)}/{self.max_states}"
         }
+
+    @staticmethod
+    def _share_or_copy(section: Any, previous: Any) -> Any:
+        """Reuse the previous snapshot's section if unchanged, else deep copy it.
+
+        Args:
+            section: Section of the state being pushed
+            previous: Same section of the previous snapshot, or None
+
+        Returns:
+            Object owned by the undo history
+        """
+        if previous is not None and section == previous:
+            return previous
+        return copy.deepcopy(section)
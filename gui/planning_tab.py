@@ -9,7 +9,7 @@ import logging
 from typing import Optional, Dict, Any, List
 import datetime
 
-from config import UI_TEXTS, COLOR_PRIMARY, COLOR_ACCENT, COLOR_LIGHT, WEEKDAYS
+from config import UI_TEXTS, COLOR_PRIMARY, COLOR_ACCENT, COLOR_LIGHT, WEEKDAYS, WEEKDAY_ORDER
 from data.data_manager import DataManager
 from data.undo_manager import UndoManager
 from logic.assignment_engine import AssignmentEngine
@@ -95,7 +95,7 @@ class PlanningTab:
         notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
         # Create a tab for each day
-        for day in ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]:
+        for day in WEEKDAY_ORDER:
             frame = tk.Frame(notebook)
             notebook.add(frame, text=WEEKDAYS[day])
 
@@ -13,6 +13,7 @@ from typing import List, Dict, Tuple, Optional, Set
 from models.student import Student
 from models.seat import Seat
 from models.assignment import Assignment
+from config import WEEKDAY_ORDER
 
 
 class AssignmentEngine:
@@ -41,13 +42,10 @@ class AssignmentEngine:
         if previous_assignments is None:
             previous_assignments = {}
 
-        # Days of the week (lowercase, as used in models)
-        days = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
-
         week_assignments = {}
         week_conflicts = {}
 
-        for day in days:
+        for day in WEEKDAY_ORDER:
             # Get previous assignments for this day if available
             prev_day_assignments = previous_assignments.get(day, [])
 
@@ -263,7 +261,7 @@ class AssignmentEngine:
         # Calculate conflict rate
         total_student_days = 0
         for student in students:
-            total_student_days += sum(1 for day in ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+            total_student_days += sum(1 for day in WEEKDAY_ORDER
                                      if student.is_available_on(day))
 
         conflict_rate = (total_conflicts / total_student_days * 100) if total_student_days > 0 else 0
@@ -8,25 +8,22 @@ This module generates professional PDF reports showing:
 - German language formatting
 """
 
+import importlib.util
+import os
+import tempfile
 from typing import Dict, List, Optional
 from datetime import datetime
 from io import BytesIO
+from pathlib import Path
 
-try:
-    from reportlab.lib.pagesizes import A4
-    from reportlab.lib import colors
-    from reportlab.lib.units import cm
-    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.enums import TA_CENTER, TA_LEFT
-    REPORTLAB_AVAILABLE = True
-except ImportError:
-    REPORTLAB_AVAILABLE = False
+# ReportLab itself is imported inside export_week_to_pdf, so importing this
+# module (the GUI does at startup) does not pay for loading it
+REPORTLAB_AVAILABLE = importlib.util.find_spec("reportlab") is not None
 
 from models.assignment import Assignment
 from models.student import Student
 from models.seat import Seat
-from config import WEEKDAYS
+from config import WEEKDAYS, WEEKDAY_ORDER
 
 
 class PdfExporter:
@@ -58,6 +55,13 @@ class PdfExporter:
         if not REPORTLAB_AVAILABLE:
             raise ImportError("ReportLab is required for PDF export. Install with: pip install reportlab")
 
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib import colors
+        from reportlab.lib.units import cm
+        from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.lib.enums import TA_CENTER
+
         # Create in-memory buffer
         buffer = BytesIO()
 
@@ -92,6 +96,25 @@ class PdfExporter:
             spaceAfter=12
         )
 
+        # Shared by every table: each command styles a whole cell range, so
+        # one style object serves any number of rows and days
+        table_style = TableStyle([
+            # Header styling
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1e3a5f')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 12),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+
+            # Body styling
+            ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
+            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 1), (-1, -1), 10),
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f0f0f0')]),
+        ])
+
         # Title
         title = Paragraph(f"Sitzplan für Woche {week}", title_style)
         story.append(title)
@@ -100,11 +123,11 @@ class PdfExporter:
         # Create lookup dictionaries
         student_dict = {s.id: s for s in students}
         seat_dict = {s.id: s for s in seats}
+        get_student = student_dict.get
+        get_seat = seat_dict.get
 
         # Generate daily tables for each day
-        days = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
-
-        for day in days:
+        for day in WEEKDAY_ORDER:
             # Day heading
             german_day = WEEKDAYS.get(day, day.capitalize())
             day_heading = Paragraph(german_day, heading_style)
@@ -114,38 +137,21 @@ class PdfExporter:
             day_assignments = assignments.get(day, [])
 
             if day_assignments:
-                # Create table data
-                table_data = [["Sitzplatz", "Student", "Raum"]]  # Header row
-
-                for assignment in day_assignments:
-                    student = student_dict.get(assignment.student_id)
-                    seat = seat_dict.get(assignment.seat_id)
-
-                    student_name = student.name if student else f"ID: {assignment.student_id}"
-                    seat_display = f"Platz {seat.number}" if seat else f"ID: {assignment.seat_id}"
-                    room_id = seat.room_id if seat else "N/A"
-
-                    table_data.append([seat_display, student_name, room_id])
+                # Create table data: header row, then one row per assignment
+                # (Sitzplatz, Student, Raum), showing raw IDs for dangling references
+                table_data = [["Sitzplatz", "Student", "Raum"]]
+                table_data.extend(
+                    [
+                        f"Platz {seat.number}" if (seat := get_seat(a.seat_id)) else f"ID: {a.seat_id}",
+                        student.name if (student := get_student(a.student_id)) else f"ID: {a.student_id}",
+                        seat.room_id if seat else "N/A",
+                    ]
+                    for a in day_assignments
+                )
 
                 # Create table
                 table = Table(table_data, colWidths=[4*cm, 8*cm, 4*cm])
-                table.setStyle(TableStyle([
-                    # Header styling
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1e3a5f')),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 0), (-1, 0), 12),
-                    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-
-                    # Body styling
-                    ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-                    ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
-                    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                    ('FONTSIZE', (0, 1), (-1, -1), 10),
-                    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f0f0f0')]),
-                ]))
+                table.setStyle(table_style)
 
                 story.append(table)
             else:
@@ -175,20 +181,7 @@ class PdfExporter:
             ]
 
             stats_table = Table(stats_data, colWidths=[8*cm, 6*cm])
-            stats_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1e3a5f')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 12),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-                ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
-                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 1), (-1, -1), 10),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f0f0f0')]),
-            ]))
+            stats_table.setStyle(table_style)
 
             story.append(stats_table)
 
@@ -214,6 +207,10 @@ class PdfExporter:
     def save_pdf_to_file(pdf_content: bytes, filename: str) -> None:
         """Save PDF content to a file.
 
+        Writes to a uniquely named temporary file next to the target and
+        renames it into place, so an interrupted save never leaves a truncated
+        PDF behind and no other file in the user's folder is touched.
+
         Args:
             pdf_content: PDF content as bytes (from export_week_to_pdf)
             filename: Path to output file
@@ -221,10 +218,16 @@ class PdfExporter:
         Raises:
             IOError: If file cannot be written
         """
+        target = Path(filename)
+        temp_path = None
         try:
-            with open(filename, 'wb') as f:
+            fd, temp_path = tempfile.mkstemp(dir=target.parent, prefix=target.name, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
                 f.write(pdf_content)
+            os.replace(temp_path, target)
         except Exception as e:
+            if temp_path is not None:
+                Path(temp_path).unlink(missing_ok=True)
             raise IOError(f"Failed to save PDF to {filename}: {str(e)}")
 
     @staticmethod
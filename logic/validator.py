@@ -9,14 +9,65 @@ This module provides validators for:
 - Assignment conflict detection
 """
 
-from datetime import datetime
+from collections import Counter
+from datetime import date, datetime
+from functools import lru_cache
 from typing import List, Tuple, Dict, Optional
 from models.room import Room
 from models.seat import Seat
-from models.student import Student
+from models.student import Student, DAY_BITS
 from models.assignment import Assignment
 
 
+@lru_cache(maxsize=4096)
+def _parse_iso_date(value: str) -> date:
+    """Parse a YYYY-MM-DD date, memoized since students share dates.
+
+    Uses strptime rather than date.fromisoformat so dates without zero
+    padding (e.g. "2025-1-5") stay valid.
+
+    Args:
+        value: Date string
+
+    Returns:
+        Parsed date
+
+    Raises:
+        ValueError: If value is not a YYYY-MM-DD date
+    """
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
+@lru_cache(maxsize=32)
+def _overlapping_pairs(boxes: Tuple[Tuple[float, float, float, float], ...]) -> Tuple[Tuple[int, int], ...]:
+    """Find overlapping rectangles, memoized for re-validating an unchanged plan.
+
+    Sweeps from left to right: a box can only overlap boxes whose right edge
+    lies beyond its left edge, so everything else drops out of the active
+    list. Touching edges do not count as overlap.
+
+    Args:
+        boxes: (left, right, top, bottom) per room
+
+    Returns:
+        Index pairs (i, j) with i < j, sorted in input order
+    """
+    active: List[int] = []
+    pairs = []
+
+    for i in sorted(range(len(boxes)), key=lambda k: boxes[k][0]):
+        left, right, top, bottom = boxes[i]
+        active = [j for j in active if boxes[j][1] > left]
+        for j in active:
+            other_left, _, other_top, other_bottom = boxes[j]
+            if other_left < right and other_top < bottom and top < other_bottom:
+                pairs.append((j, i) if j < i else (i, j))
+        active.append(i)
+
+    pairs.sort()
+    return tuple(pairs)
+
+
 class Validator:
     """Business rule validator for seating management."""
 
@@ -32,20 +83,8 @@ class Validator:
                 is_valid: True if no overlaps detected, False otherwise
                 conflicts: List of tuples (room1_id, room2_id) that overlap
         """
-        conflicts = []
-
-        for i, room1 in enumerate(rooms):
-            for room2 in rooms[i+1:]:
-                # Check if rectangles overlap
-                # Two rectangles DON'T overlap if one is completely to the left/right/above/below the other
-                # So they DO overlap if NONE of these conditions are true
-                if not (
-                    room1.x + room1.width <= room2.x or  # room1 is completely left of room2
-                    room2.x + room2.width <= room1.x or  # room2 is completely left of room1
-                    room1.y + room1.height <= room2.y or  # room1 is completely above room2
-                    room2.y + room2.height <= room1.y     # room2 is completely above room1
-                ):
-                    conflicts.append((room1.id, room2.id))
+        boxes = tuple((room.x, room.x + room.width, room.y, room.y + room.height) for room in rooms)
+        conflicts = [(rooms[i].id, rooms[j].id) for i, j in _overlapping_pairs(boxes)]
 
         return (len(conflicts) == 0, conflicts)
 
@@ -81,10 +120,53 @@ class Validator:
                 is_valid: True if capacity is sufficient, False if overbooking
                 details: Dict with 'students_count', 'seats_count', 'excess'
         """
-        # Count students available on this day
-        students_available = sum(1 for s in students if s.is_available_on(day))
+        # Count students available on this day: one AND per student
+        mask = DAY_BITS.get(day.lower(), 0)
+        students_available = sum(1 for s in students if s.pattern_bits & mask)
+        return Validator._capacity_result(students_available, len(seats))
+
+    @staticmethod
+    def validate_capacity_multiday(
+        students: List[Student], seats: List[Seat], days: List[str]
+    ) -> Dict[str, Tuple[bool, Dict[str, int]]]:
+        """Check capacity for several days, visiting each student only once.
+
+        Equivalent to calling validate_capacity for every day, but walks
+        each student's weekly pattern once instead of once per day.
+
+        Args:
+            students: List of all students
+            seats: List of all available seats
+            days: Days of week to check (e.g., WEEKDAY_ORDER) - case insensitive
+
+        Returns:
+            Dict mapping each day to the (is_valid, details) tuple that
+            validate_capacity returns for it
+        """
+        counts = Counter(
+            day
+            for s in students
+            for day, available in s.weekly_pattern.items()
+            if available
+        )
         seats_count = len(seats)
 
+        return {
+            day: Validator._capacity_result(counts[day.lower()], seats_count)
+            for day in days
+        }
+
+    @staticmethod
+    def _capacity_result(students_available: int, seats_count: int) -> Tuple[bool, Dict[str, int]]:
+        """Build the capacity check result for one day.
+
+        Args:
+            students_available: Number of students attending that day
+            seats_count: Number of available seats
+
+        Returns:
+            Tuple of (is_valid, details) as returned by validate_capacity
+        """
         is_valid = students_available <= seats_count
         excess = max(0, students_available - seats_count)
 
@@ -115,8 +197,8 @@ class Validator:
 
         try:
             # Parse dates in ISO format (YYYY-MM-DD)
-            date_from = datetime.strptime(student.valid_from, "%Y-%m-%d")
-            date_until = datetime.strptime(student.valid_until, "%Y-%m-%d")
+            date_from = _parse_iso_date(student.valid_from)
+            date_until = _parse_iso_date(student.valid_until)
 
             if date_from > date_until:
                 return (False, f"valid_from ({student.valid_from}) is after valid_until ({student.valid_until})")
@@ -198,17 +280,15 @@ class Validator:
         # Create room lookup dictionary
         room_dict = {room.id: room for room in rooms}
 
-        invalid_seats = []
-
-        for seat in seats:
-            # Check if room exists
-            if seat.room_id not in room_dict:
-                invalid_seats.append(seat.id)
-                continue
+        get_room = room_dict.get
 
-            # Check if seat is within room bounds
-            room = room_dict[seat.room_id]
-            if not Validator.validate_seat_in_room(seat, room):
-                invalid_seats.append(seat.id)
+        # A seat is invalid if its room is missing or it lies outside it. The
+        # room was looked up by seat.room_id, so validate_seat_in_room's
+        # room_id check is implied and only the bounds test remains.
+        invalid_seats = [
+            seat.id
+            for seat in seats
+            if (room := get_room(seat.room_id)) is None or not room.contains_point(seat.x, seat.y)
+        ]
 
         return (len(invalid_seats) == 0, invalid_seats)
@@ -1,5 +1,6 @@
 """Assignment model for Sitzplatz-Manager."""
 
+import sys
 from dataclasses import dataclass
 
 
@@ -13,11 +14,21 @@ class Assignment:
         day: Day of week (e.g., "monday", lowercase)
         week: Week identifier (e.g., "2025-W43")
     """
+    # No per-instance __dict__; dataclass(slots=True) would need Python 3.10
+    __slots__ = ("student_id", "seat_id", "day", "week")
+
     student_id: str
     seat_id: str
     day: str
     week: str
 
+    def __post_init__(self) -> None:
+        """Intern string IDs, which repeat across days and weeks."""
+        if isinstance(self.student_id, str):
+            self.student_id = sys.intern(self.student_id)
+        if isinstance(self.seat_id, str):
+            self.seat_id = sys.intern(self.seat_id)
+
     def get_key(self) -> str:
         """Return unique identifier for this assignment.
 
@@ -47,6 +58,20 @@ class Assignment:
             "week": self.week
         }
 
+    def to_persist_dict(self) -> dict:
+        """Convert assignment to the compact form stored in data.json.
+
+        Week and day are implied by the position in the
+        assignments[week][day] list, so only the IDs are kept.
+
+        Returns:
+            Dictionary with student_id and seat_id
+        """
+        return {
+            "student_id": self.student_id,
+            "seat_id": self.seat_id
+        }
+
     @classmethod
     def from_dict(cls, data: dict) -> "Assignment":
         """Create Assignment instance from dictionary.
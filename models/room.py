@@ -1,5 +1,6 @@
 """Room model for Sitzplatz-Manager."""
 
+import sys
 from dataclasses import dataclass, field
 from typing import Optional
 
@@ -25,6 +26,11 @@ class Room:
     height: float
     color: str = "#1e3a5f"
 
+    def __post_init__(self) -> None:
+        """Intern a string ID so equal IDs share one string object."""
+        if isinstance(self.id, str):
+            self.id = sys.intern(self.id)
+
     def contains_point(self, px: float, py: float) -> bool:
         """Check if point (px, py) is within room bounds.
 
@@ -1,5 +1,6 @@
 """Seat model for Sitzplatz-Manager."""
 
+import sys
 from dataclasses import dataclass, field
 from typing import Dict, Any
 
@@ -23,6 +24,13 @@ class Seat:
     y: float
     properties: Dict[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        """Intern string IDs so equal IDs share one string object."""
+        if isinstance(self.id, str):
+            self.id = sys.intern(self.id)
+        if isinstance(self.room_id, str):
+            self.room_id = sys.intern(self.room_id)
+
     def get_display_name(self) -> str:
         """Return formatted display name for UI.
 
@@ -1,7 +1,61 @@
 """Student model for Sitzplatz-Manager."""
 
+import sys
 from dataclasses import dataclass, field
-from typing import Dict, List
+from typing import Dict, List, Tuple
+
+from config import WEEKDAY_ORDER
+
+
+# Bit per weekday for Student.pattern_bits (Monday = bit 0)
+DAY_BITS: Dict[str, int] = {day: 1 << i for i, day in enumerate(WEEKDAY_ORDER)}
+
+
+class _FrozenPattern(dict):
+    """Read-only weekly pattern, shared between students with equal patterns.
+
+    Subclasses dict so lookups and JSON serialization behave exactly like a
+    plain pattern dict. Any attempt to modify it raises TypeError. The
+    DAY_BITS mask of attending days is computed once and kept in ``bits``.
+    """
+
+    def __init__(self, pattern: Dict[str, bool]):
+        super().__init__(pattern)
+        self.bits = sum(bit for day, bit in DAY_BITS.items() if pattern.get(day))
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("weekly_pattern is shared and read-only; assign a new dict instead")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __copy__(self) -> "_FrozenPattern":
+        return self
+
+    def __deepcopy__(self, memo: dict) -> "_FrozenPattern":
+        return self
+
+    def __reduce__(self):
+        return (_intern_pattern, (dict(self),))
+
+
+_PATTERN_CACHE: Dict[Tuple[Tuple[str, bool], ...], _FrozenPattern] = {}
+
+
+def _intern_pattern(pattern: Dict[str, bool]) -> _FrozenPattern:
+    """Return the shared read-only instance for a weekly pattern.
+
+    Args:
+        pattern: Attendance per day
+
+    Returns:
+        Cached _FrozenPattern equal to pattern
+    """
+    key = tuple(pattern.items())
+    cached = _PATTERN_CACHE.get(key)
+    if cached is None:
+        cached = _PATTERN_CACHE[key] = _FrozenPattern(pattern)
+    return cached
 
 
 @dataclass
@@ -15,6 +69,12 @@ class Student:
         valid_from: Start date (ISO format: YYYY-MM-DD)
         valid_until: End date (ISO format: YYYY-MM-DD) or "ongoing"
         requirements: List of seat property requirements (e.g., ["near_window"])
+        pattern_bits: Read-only weekly_pattern as a DAY_BITS mask
+
+    Students with equal weekly patterns share one read-only pattern object.
+    weekly_pattern must not be modified in place (item assignment, update()
+    and friends raise TypeError); to change it, assign a whole new dict. Every
+    assignment, at construction or later, is replaced by the shared instance.
     """
     id: str
     name: str
@@ -31,6 +91,22 @@ class Student:
     valid_until: str = "ongoing"
     requirements: List[str] = field(default_factory=list)
 
+    def __post_init__(self) -> None:
+        """Intern a string ID."""
+        if isinstance(self.id, str):
+            self.id = sys.intern(self.id)
+
+    def __setattr__(self, name: str, value) -> None:
+        """Swap any assigned weekly_pattern for its shared read-only instance."""
+        if name == "weekly_pattern":
+            value = _intern_pattern(value)
+        super().__setattr__(name, value)
+
+    @property
+    def pattern_bits(self) -> int:
+        """weekly_pattern as a DAY_BITS mask (Monday = bit 0)."""
+        return self.weekly_pattern.bits
+
     def is_available_on(self, day: str) -> bool:
         """Check if student is available on given day.
 
@@ -71,7 +147,7 @@ class Student:
         return {
             "id": self.id,
             "name": self.name,
-            "weekly_pattern": self.weekly_pattern,
+            "weekly_pattern": dict(self.weekly_pattern),
             "valid_from": self.valid_from,
             "valid_until": self.valid_until,
             "requirements": self.requirements
@@ -47,6 +47,7 @@ OPTIONS = {
             "logging",
             "dataclasses",
             "reportlab",
+            "orjson",
         ],
 
         # Exclude unnecessary modules to reduce bundle size
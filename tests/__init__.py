@@ -1 +1,7 @@
 """Unit tests for Sitzplatz-Manager data layer."""
+
+import os
+import sys
+
+# Back temp directories with RAM (tmpfs) on Linux where available
+_TMP_ROOT = "/dev/shm" if sys.platform.startswith("linux") and os.path.isdir("/dev/shm") else None
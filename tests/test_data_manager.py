@@ -1,6 +1,7 @@
 """Unit tests for DataManager."""
 
 import unittest
+from unittest.mock import patch
 import json
 import tempfile
 from pathlib import Path
@@ -10,7 +11,9 @@ import os
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from data import json_codec
 from data.data_manager import DataManager
+from tests import _TMP_ROOT
 
 
 class TestDataManager(unittest.TestCase):
@@ -18,7 +21,7 @@ class TestDataManager(unittest.TestCase):
 
     def setUp(self) -> None:
         """Set up test fixtures with temporary directory."""
-        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_dir = tempfile.TemporaryDirectory(dir=_TMP_ROOT)
         self.data_manager = DataManager(self.temp_dir.name)
 
     def tearDown(self) -> None:
@@ -68,6 +71,32 @@ class TestDataManager(unittest.TestCase):
         self.assertEqual(len(loaded_data["floorplan"]["rooms"]), 1)
         self.assertEqual(loaded_data["floorplan"]["rooms"][0]["id"], "room_001")
 
+    def test_save_and_load_identical_across_codecs(self) -> None:
+        """Test that stdlib json and orjson produce the same round-trip result."""
+        original_data = self.data_manager._create_empty_data()
+        original_data["students"].append({
+            "id": "student_001",
+            "name": "Jürgen Müller",
+            "weekly_pattern": {"monday": True, "tuesday": False},
+            "valid_from": "2025-01-01",
+            "valid_until": "ongoing",
+            "requirements": ["near_window"]
+        })
+        original_data["assignments"]["2025-W43"] = {
+            "monday": [{"student_id": "student_001", "seat_id": "seat_001"}]
+        }
+
+        codecs = [False, True] if json_codec.ORJSON_AVAILABLE else [False]
+        for use_orjson in codecs:
+            with self.subTest(orjson=use_orjson):
+                with patch.object(json_codec, "ORJSON_AVAILABLE", use_orjson):
+                    self.data_manager.save_data(original_data, create_backup=False)
+                    loaded_data = self.data_manager.load_data()
+
+                self.assertEqual(loaded_data, original_data)
+                # Both codecs write readable, non-escaped UTF-8
+                self.assertIn("Jürgen Müller", self.data_manager.data_file.read_text(encoding='utf-8'))
+
     def test_backup_data(self) -> None:
         """Test backup creation."""
         # Create initial data file
@@ -23,6 +23,7 @@ from models.student import Student
 from models.seat import Seat
 from models.room import Room
 from models.assignment import Assignment
+from tests import _TMP_ROOT
 
 
 class TestFloorplanCreationWorkflow(unittest.TestCase):
@@ -30,7 +31,7 @@ class TestFloorplanCreationWorkflow(unittest.TestCase):
 
     def setUp(self) -> None:
         """Set up test fixtures."""
-        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_dir = tempfile.TemporaryDirectory(dir=_TMP_ROOT)
         self.data_manager = DataManager(self.temp_dir.name)
 
     def tearDown(self) -> None:
@@ -144,7 +145,7 @@ class TestStudentManagementWorkflow(unittest.TestCase):
 
     def setUp(self) -> None:
         """Set up test fixtures."""
-        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_dir = tempfile.TemporaryDirectory(dir=_TMP_ROOT)
         self.data_manager = DataManager(self.temp_dir.name)
 
     def tearDown(self) -> None:
@@ -217,7 +218,7 @@ class TestSeatingAssignmentWorkflow(unittest.TestCase):
 
     def setUp(self) -> None:
         """Set up test fixtures."""
-        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_dir = tempfile.TemporaryDirectory(dir=_TMP_ROOT)
         self.data_manager = DataManager(self.temp_dir.name)
 
     def tearDown(self) -> None:
@@ -328,7 +329,7 @@ class TestPdfExportWorkflow(unittest.TestCase):
 
     def setUp(self) -> None:
         """Set up test fixtures."""
-        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_dir = tempfile.TemporaryDirectory(dir=_TMP_ROOT)
         self.data_manager = DataManager(self.temp_dir.name)
         self.pdf_exporter = PdfExporter()
 
@@ -411,7 +412,7 @@ class TestCompleteApplicationWorkflow(unittest.TestCase):
 
     def setUp(self) -> None:
         """Set up test fixtures."""
-        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_dir = tempfile.TemporaryDirectory(dir=_TMP_ROOT)
         self.data_manager = DataManager(self.temp_dir.name)
         self.validator = Validator()
 
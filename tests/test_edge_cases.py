@@ -19,6 +19,7 @@ from logic.validator import Validator
 from models.student import Student
 from models.seat import Seat
 from models.room import Room
+from tests import _TMP_ROOT
 
 
 class TestDataCorruption(unittest.TestCase):
@@ -26,7 +27,7 @@ class TestDataCorruption(unittest.TestCase):
 
     def setUp(self) -> None:
         """Set up test fixtures."""
-        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_dir = tempfile.TemporaryDirectory(dir=_TMP_ROOT)
         self.data_manager = DataManager(self.temp_dir.name)
 
     def tearDown(self) -> None:
@@ -104,7 +105,7 @@ class TestMissingResources(unittest.TestCase):
 
     def setUp(self) -> None:
         """Set up test fixtures."""
-        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_dir = tempfile.TemporaryDirectory(dir=_TMP_ROOT)
         self.data_manager = DataManager(self.temp_dir.name)
 
     def tearDown(self) -> None:
@@ -176,7 +177,7 @@ class TestBoundaryConditions(unittest.TestCase):
 
     def setUp(self) -> None:
         """Set up test fixtures."""
-        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_dir = tempfile.TemporaryDirectory(dir=_TMP_ROOT)
         self.data_manager = DataManager(self.temp_dir.name)
         self.validator = Validator()
 
@@ -413,7 +414,7 @@ class TestInvalidInputs(unittest.TestCase):
 
     def test_none_values_in_data(self) -> None:
         """Test handling of None values."""
-        data_manager = DataManager(tempfile.TemporaryDirectory().name)
+        data_manager = DataManager(tempfile.TemporaryDirectory(dir=_TMP_ROOT).name)
 
         data = data_manager._create_empty_data()
         data["floorplan"]["rooms"] = [
@@ -426,7 +427,7 @@ class TestInvalidInputs(unittest.TestCase):
 
     def test_empty_list_vs_missing_field(self) -> None:
         """Test difference between empty list and missing field."""
-        data_manager = DataManager(tempfile.TemporaryDirectory().name)
+        data_manager = DataManager(tempfile.TemporaryDirectory(dir=_TMP_ROOT).name)
 
         # Valid: empty list
         data1 = data_manager._create_empty_data()
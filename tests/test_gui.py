@@ -4,49 +4,104 @@ Tests MainWindow, FloorplanTab, StudentsTab, and PlanningTab functionality
 focusing on integration and data handling.
 """
 
+import copy
+import operator
+import queue
+import shutil
+import threading
 import unittest
-from unittest.mock import Mock, MagicMock, patch
 import tempfile
 import json
 from pathlib import Path
 
-from config import UI_TEXTS, WEEKDAYS
+from config import DATA_FILE, UI_TEXTS, WEEKDAYS
 from data.data_manager import DataManager
 from data.undo_manager import UndoManager
+from logic.assignment_engine import AssignmentEngine
+from logic.pdf_exporter import PdfExporter
+from logic.validator import Validator
+from tests import _TMP_ROOT
 
+# Empty data file contents, built and serialized once and written into each
+# test's temp directory so load_data reads an existing file instead of taking
+# the missing-file branch.
+with tempfile.TemporaryDirectory(dir=_TMP_ROOT) as _template_dir:
+    _EMPTY_BLOB = json.dumps(DataManager(_template_dir)._create_empty_data()).encode("utf-8")
 
-class TestGUIConstants(unittest.TestCase):
-    """Test that GUI constants are properly configured."""
+_REQUIRED_UI_KEYS = frozenset({
+    "app_title", "file_menu", "edit_menu", "help_menu",
+    "save", "save_button", "cancel", "add_student",
+    "floorplan_tab", "students_tab", "planning_tab"
+})
+_EXPECTED_DAYS = frozenset({
+    "monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"
+})
 
-    def test_ui_texts_german(self) -> None:
-        """Test that UI texts are in German."""
-        german_texts = [
-            UI_TEXTS.get("file_menu") == "Datei",
-            UI_TEXTS.get("edit_menu") == "Bearbeiten",
-            UI_TEXTS.get("help_menu") == "Hilfe",
-            UI_TEXTS.get("save") == "Speichern",
-            UI_TEXTS.get("add_student") == "Schüler hinzufügen",
-            UI_TEXTS.get("auto_assign") == "Automatisch zuteilen",
-        ]
 
-        self.assertTrue(all(german_texts), "Some UI texts are not in German")
+# Temp directories are handed to a background thread for removal so rmtree
+# latency stays off each test's critical path.
+_CLEANUP_QUEUE: "queue.Queue[str]" = queue.Queue()
 
-    def test_ui_texts_completeness(self) -> None:
-        """Test that all required UI texts are present."""
-        required_keys = [
-            "app_title", "file_menu", "edit_menu", "help_menu",
-            "save", "save_button", "cancel", "add_student",
-            "floorplan_tab", "students_tab", "planning_tab"
-        ]
 
-        for key in required_keys:
-            self.assertIn(key, UI_TEXTS, f"Missing UI text: {key}")
+def _cleanup_worker() -> None:
+    """Remove queued temp directories until the process exits."""
+    while True:
+        path = _CLEANUP_QUEUE.get()
+        shutil.rmtree(path, ignore_errors=True)
+        _CLEANUP_QUEUE.task_done()
+
+
+# Backups are never asserted on here; setUpModule disables them for the whole
+# module so no save can write backup copies, and tearDownModule restores them.
+_BACKUP_DATA = DataManager.backup_data
+
 
-    def test_weekdays_complete(self) -> None:
-        """Test that all weekdays are defined."""
-        expected_days = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
-        for day in expected_days:
-            self.assertIn(day, WEEKDAYS, f"Missing weekday: {day}")
+def setUpModule() -> None:
+    """Disable DataManager backups and start the temp dir cleanup worker."""
+    DataManager.backup_data = lambda self: ""
+    threading.Thread(target=_cleanup_worker, daemon=True).start()
+
+
+def tearDownModule() -> None:
+    """Restore DataManager backups and wait for pending temp dir removals."""
+    DataManager.backup_data = _BACKUP_DATA
+    _CLEANUP_QUEUE.join()
+
+
+class _DMFixtureMixin:
+    """Provides a DataManager on a fresh temp dir seeded with an empty data file."""
+
+    seed_data_file = True
+
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp(dir=_TMP_ROOT)
+        self.addCleanup(_CLEANUP_QUEUE.put, self.temp_dir)
+        if self.seed_data_file:
+            (Path(self.temp_dir) / DATA_FILE).write_bytes(_EMPTY_BLOB)
+        self.data_manager = DataManager(self.temp_dir)
+
+
+class TestGUIConstants(unittest.TestCase):
+    """Test that GUI constants are properly configured."""
+
+    def test_ui_constants(self) -> None:
+        """Test that UI texts are German and complete, and all weekdays are defined."""
+        german_texts = {
+            "file_menu": "Datei",
+            "edit_menu": "Bearbeiten",
+            "help_menu": "Hilfe",
+            "save": "Speichern",
+            "add_student": "Schüler hinzufügen",
+            "auto_assign": "Automatisch zuteilen",
+        }
+        self.assertEqual({key: UI_TEXTS.get(key) for key in german_texts}, german_texts)
+
+        missing_keys = _REQUIRED_UI_KEYS - UI_TEXTS.keys()
+        self.assertFalse(missing_keys, f"Missing UI texts: {sorted(missing_keys)}")
+
+        missing_days = _EXPECTED_DAYS - WEEKDAYS.keys()
+        self.assertFalse(missing_days, f"Missing weekdays: {sorted(missing_days)}")
 
 
 class TestUndoManagerIntegration(unittest.TestCase):
@@ -117,17 +172,11 @@ class TestUndoManagerIntegration(unittest.TestCase):
         self.assertFalse(self.undo_manager.can_redo())
 
 
-class TestDataManagerBasics(unittest.TestCase):
+class TestDataManagerBasics(_DMFixtureMixin, unittest.TestCase):
     """Test basic DataManager functionality for GUI use."""
 
-    def setUp(self) -> None:
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.TemporaryDirectory()
-        self.data_manager = DataManager(self.temp_dir.name)
-
-    def tearDown(self) -> None:
-        """Clean up test fixtures."""
-        self.temp_dir.cleanup()
+    # These tests cover loading when no data file exists yet
+    seed_data_file = False
 
     def test_load_data_creates_empty_file(self) -> None:
         """Test that load_data creates empty file structure if missing."""
@@ -163,10 +212,10 @@ class TestDataManagerBasics(unittest.TestCase):
             "requirements": {}
         })
 
-        self.data_manager.save_data(data, create_backup=False)
+        self.data_manager.save_data(data)
 
         # Create new manager and reload
-        data_manager2 = DataManager(self.temp_dir.name)
+        data_manager2 = DataManager(self.temp_dir)
         loaded_data = data_manager2.load_data()
 
         self.assertEqual(len(loaded_data["students"]), 1)
@@ -176,45 +225,25 @@ class TestDataManagerBasics(unittest.TestCase):
 class TestGUIIntegrationWithLogic(unittest.TestCase):
     """Test GUI integration with business logic layer."""
 
-    def test_assignment_engine_available(self) -> None:
-        """Test that AssignmentEngine is available for GUI."""
-        from logic.assignment_engine import AssignmentEngine
-
-        # Verify key methods exist
-        self.assertTrue(hasattr(AssignmentEngine, 'assign_week'))
-        self.assertTrue(hasattr(AssignmentEngine, 'assign_day'))
-        self.assertTrue(hasattr(AssignmentEngine, 'get_assignment_statistics'))
-
-    def test_validator_available(self) -> None:
-        """Test that Validator is available for GUI."""
-        from logic.validator import Validator
-
-        # Verify key methods exist
-        self.assertTrue(hasattr(Validator, 'validate_room_overlap'))
-        self.assertTrue(hasattr(Validator, 'validate_seat_in_room'))
-        self.assertTrue(hasattr(Validator, 'validate_capacity'))
-
-    def test_pdf_exporter_available(self) -> None:
-        """Test that PdfExporter is available for GUI."""
-        from logic.pdf_exporter import PdfExporter
+    def test_logic_modules_expose_expected_api(self) -> None:
+        """Test that logic components expose the methods the GUI relies on."""
+        expected_api = [
+            (AssignmentEngine, ("assign_week", "assign_day", "get_assignment_statistics")),
+            (Validator, ("validate_room_overlap", "validate_seat_in_room", "validate_capacity")),
+            (PdfExporter, ("export_week_to_pdf", "save_pdf_to_file")),
+        ]
 
-        # Verify key methods exist
-        self.assertTrue(hasattr(PdfExporter, 'export_week_to_pdf'))
-        self.assertTrue(hasattr(PdfExporter, 'save_pdf_to_file'))
+        for component, method_names in expected_api:
+            with self.subTest(component=component.__name__):
+                try:
+                    operator.attrgetter(*method_names)(component)
+                except AttributeError as e:
+                    self.fail(str(e))
 
 
-class TestFloorplanDataStructure(unittest.TestCase):
+class TestFloorplanDataStructure(_DMFixtureMixin, unittest.TestCase):
     """Test data structures for floorplan."""
 
-    def setUp(self) -> None:
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.TemporaryDirectory()
-        self.data_manager = DataManager(self.temp_dir.name)
-
-    def tearDown(self) -> None:
-        """Clean up test fixtures."""
-        self.temp_dir.cleanup()
-
     def test_room_structure(self) -> None:
         """Test that rooms can be added to floorplan."""
         data = self.data_manager.load_data()
@@ -229,10 +258,10 @@ class TestFloorplanDataStructure(unittest.TestCase):
         }
 
         data["floorplan"]["rooms"].append(room)
-        self.data_manager.save_data(data, create_backup=False)
+        self.data_manager.save_data(data)
 
         # Reload and verify
-        data_manager2 = DataManager(self.temp_dir.name)
+        data_manager2 = DataManager(self.temp_dir)
         loaded_data = data_manager2.load_data()
 
         self.assertEqual(len(loaded_data["floorplan"]["rooms"]), 1)
@@ -251,28 +280,19 @@ class TestFloorplanDataStructure(unittest.TestCase):
         }
 
         data["floorplan"]["seats"].append(seat)
-        self.data_manager.save_data(data, create_backup=False)
+        self.data_manager.save_data(data)
 
         # Reload and verify
-        data_manager2 = DataManager(self.temp_dir.name)
+        data_manager2 = DataManager(self.temp_dir)
         loaded_data = data_manager2.load_data()
 
         self.assertEqual(len(loaded_data["floorplan"]["seats"]), 1)
         self.assertEqual(loaded_data["floorplan"]["seats"][0]["number"], 1)
 
 
-class TestStudentDataStructure(unittest.TestCase):
+class TestStudentDataStructure(_DMFixtureMixin, unittest.TestCase):
     """Test data structures for students."""
 
-    def setUp(self) -> None:
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.TemporaryDirectory()
-        self.data_manager = DataManager(self.temp_dir.name)
-
-    def tearDown(self) -> None:
-        """Clean up test fixtures."""
-        self.temp_dir.cleanup()
-
     def test_student_structure(self) -> None:
         """Test student data structure."""
         data = self.data_manager.load_data()
@@ -298,10 +318,10 @@ class TestStudentDataStructure(unittest.TestCase):
         }
 
         data["students"].append(student)
-        self.data_manager.save_data(data, create_backup=False)
+        self.data_manager.save_data(data)
 
         # Reload and verify
-        data_manager2 = DataManager(self.temp_dir.name)
+        data_manager2 = DataManager(self.temp_dir)
         loaded_data = data_manager2.load_data()
 
         self.assertEqual(len(loaded_data["students"]), 1)
@@ -329,18 +349,9 @@ class TestStudentDataStructure(unittest.TestCase):
         self.assertEqual(len(filtered), 2)  # Alice and Charlie
 
 
-class TestAssignmentDataStructure(unittest.TestCase):
+class TestAssignmentDataStructure(_DMFixtureMixin, unittest.TestCase):
     """Test data structures for weekly assignments."""
 
-    def setUp(self) -> None:
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.TemporaryDirectory()
-        self.data_manager = DataManager(self.temp_dir.name)
-
-    def tearDown(self) -> None:
-        """Clean up test fixtures."""
-        self.temp_dir.cleanup()
-
     def test_assignment_structure(self) -> None:
         """Test assignment data structure."""
         data = self.data_manager.load_data()
@@ -360,29 +371,29 @@ class TestAssignmentDataStructure(unittest.TestCase):
         }
 
         data["assignments"][week] = assignment
-        self.data_manager.save_data(data, create_backup=False)
+        self.data_manager.save_data(data)
 
         # Reload and verify
-        data_manager2 = DataManager(self.temp_dir.name)
+        data_manager2 = DataManager(self.temp_dir)
         loaded_data = data_manager2.load_data()
 
         self.assertIn(week, loaded_data["assignments"])
         self.assertEqual(len(loaded_data["assignments"][week]["monday"]), 2)
 
 
-class TestGUIWorkflow(unittest.TestCase):
+class TestGUIWorkflow(_DMFixtureMixin, unittest.TestCase):
     """Test complete GUI workflow scenarios."""
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Load the empty data structure once for all workflow tests."""
+        cls.empty_data = json.loads(_EMPTY_BLOB)
+
     def setUp(self) -> None:
         """Set up test fixtures."""
-        self.temp_dir = tempfile.TemporaryDirectory()
-        self.data_manager = DataManager(self.temp_dir.name)
+        super().setUp()
         self.undo_manager = UndoManager()
 
-    def tearDown(self) -> None:
-        """Clean up test fixtures."""
-        self.temp_dir.cleanup()
-
     def test_create_floorplan_workflow(self) -> None:
         """Test creating a floorplan (add rooms and seats)."""
         data = self.data_manager.load_data()
@@ -392,18 +403,20 @@ class TestGUIWorkflow(unittest.TestCase):
         data["floorplan"]["rooms"].append(room)
 
         # Add seats
-        for i in range(1, 11):
-            seat = {
+        seats = [
+            {
                 "id": f"seat_{i}",
                 "number": i,
                 "room_id": "room_1",
                 "x": 100 + (i % 5) * 30,
                 "y": 100 + (i // 5) * 30
             }
-            data["floorplan"]["seats"].append(seat)
+            for i in range(1, 11)
+        ]
+        data["floorplan"]["seats"].extend(seats)
 
         self.undo_manager.push_state(data)
-        self.data_manager.save_data(data, create_backup=False)
+        self.data_manager.save_data(data)
 
         # Verify
         loaded_data = self.data_manager.load_data()
@@ -415,8 +428,8 @@ class TestGUIWorkflow(unittest.TestCase):
         data = self.data_manager.load_data()
 
         # Add students
-        for i in range(1, 6):
-            student = {
+        students = [
+            {
                 "id": f"student_{i}",
                 "name": f"Student {i}",
                 "valid_from": "2025-01-01",
@@ -427,10 +440,12 @@ class TestGUIWorkflow(unittest.TestCase):
                 },
                 "requirements": {}
             }
-            data["students"].append(student)
+            for i in range(1, 6)
+        ]
+        data["students"].extend(students)
 
         self.undo_manager.push_state(data)
-        self.data_manager.save_data(data, create_backup=False)
+        self.data_manager.save_data(data)
 
         # Verify
         loaded_data = self.data_manager.load_data()
@@ -438,16 +453,16 @@ class TestGUIWorkflow(unittest.TestCase):
 
     def test_undo_redo_workflow(self) -> None:
         """Test undo/redo functionality in GUI workflow."""
-        data1 = self.data_manager.load_data()
+        data1 = copy.deepcopy(self.empty_data)
         self.undo_manager.push_state(data1)
 
         # Create multiple states
-        data2 = self.data_manager.load_data()
+        data2 = copy.deepcopy(self.empty_data)
         data2["students"].append({"id": "s1", "name": "Test", "valid_from": "2025-01-01",
                                   "valid_until": "2025-12-31", "weekly_pattern": {}, "requirements": {}})
         self.undo_manager.push_state(data2)
 
-        data3 = self.data_manager.load_data()
+        data3 = copy.deepcopy(self.empty_data)
         data3["students"].append({"id": "s2", "name": "Test2", "valid_from": "2025-01-01",
                                   "valid_until": "2025-12-31", "weekly_pattern": {}, "requirements": {}})
         self.undo_manager.push_state(data3)
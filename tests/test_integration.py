@@ -4,14 +4,17 @@ Tests the interaction between layers:
 - Data Layer (DataManager, LockManager, UndoManager)
 - Logic Layer (AssignmentEngine, Validator, PdfExporter)
 - GUI Layer components
+
+Every test works in its own temporary directory (or none at all), so the
+module is safe to run in parallel workers, e.g. ``pytest -n auto`` with
+pytest-xdist installed.
 """
 
+import copy
 import unittest
 import tempfile
 import json
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, Any
 
 from data.data_manager import DataManager
 from data.undo_manager import UndoManager
@@ -21,7 +24,32 @@ from logic.validator import Validator
 from models.student import Student
 from models.seat import Seat
 from models.room import Room
-from models.assignment import Assignment
+from tests import _TMP_ROOT
+
+# Fixed timestamp for state fixtures; tests never depend on the actual time
+_FIXED_TS = "2025-01-01T00:00:00"
+
+# Deterministic seat/student lists for the save/load cycle test
+_SEATS_FIXTURE = [
+    {"id": f"s{i}", "room_id": f"r{(i % 2) + 1}", "number": i, "x": i*20, "y": 0}
+    for i in range(10)
+]
+_STUDENTS_FIXTURE = [
+    {
+        "id": f"st{i}",
+        "name": f"Student {i}",
+        "weekly_pattern": {
+            "monday": i % 2 == 0,
+            "tuesday": i % 3 == 0,
+            "wednesday": True
+        }
+    }
+    for i in range(5)
+]
+
+# Canonical empty data structure, built once and deep-copied by tests
+with tempfile.TemporaryDirectory(dir=_TMP_ROOT) as _template_dir:
+    _EMPTY_TEMPLATE = DataManager(_template_dir)._create_empty_data()
 
 
 class TestDataLogicIntegration(unittest.TestCase):
@@ -29,7 +57,7 @@ class TestDataLogicIntegration(unittest.TestCase):
 
     def setUp(self) -> None:
         """Set up test fixtures."""
-        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_dir = tempfile.TemporaryDirectory(dir=_TMP_ROOT)
         self.data_manager = DataManager(self.temp_dir.name)
         self.validator = Validator()
 
@@ -63,19 +91,10 @@ class TestDataLogicIntegration(unittest.TestCase):
 
         # Save to data manager
         data = self.data_manager.load_data()
-        data["students"] = [
-            {"id": s.id, "name": s.name, "weekly_pattern": s.weekly_pattern}
-            for s in students
-        ]
-        data["floorplan"]["seats"] = [
-            {"id": s.id, "room_id": s.room_id, "number": s.number, "x": s.x, "y": s.y}
-            for s in seats
-        ]
+        data["students"] = [s.to_dict() for s in students]
+        data["floorplan"]["seats"] = [s.to_dict() for s in seats]
         data["assignments"]["2025-W43"] = {
-            "monday": [
-                {"student_id": a.student_id, "seat_id": a.seat_id}
-                for a in assignments
-            ]
+            "monday": [a.to_persist_dict() for a in assignments]
         }
         self.data_manager.save_data(data, create_backup=False)
 
@@ -83,48 +102,6 @@ class TestDataLogicIntegration(unittest.TestCase):
         loaded_data = self.data_manager.load_data()
         self.assertEqual(len(loaded_data["assignments"]["2025-W43"]["monday"]), 2)
 
-    def test_validator_with_loaded_data(self) -> None:
-        """Test Validator validates loaded data correctly."""
-        # Create valid data
-        data = self.data_manager._create_empty_data()
-        data["floorplan"]["rooms"] = [
-            {"id": "r1", "name": "Room A", "x": 50, "y": 50, "width": 400, "height": 300}
-        ]
-        data["floorplan"]["seats"] = [
-            {"id": "s1", "room_id": "r1", "number": 1, "x": 60, "y": 60}
-        ]
-
-        # Validate
-        is_valid, errors = self.data_manager.validate_data(data)
-        self.assertTrue(is_valid)
-
-    def test_undo_manager_with_assignment_changes(self) -> None:
-        """Test UndoManager tracks assignment changes."""
-        undo_manager = UndoManager()
-
-        # Create initial state
-        state1 = {
-            "assignments": {"2025-W43": {"monday": []}},
-            "timestamp": datetime.now().isoformat()
-        }
-        undo_manager.push_state(state1)
-
-        # Modify state
-        state2 = {
-            "assignments": {"2025-W43": {"monday": [{"student_id": "st1", "seat_id": "s1"}]}},
-            "timestamp": datetime.now().isoformat()
-        }
-        undo_manager.push_state(state2)
-
-        # Verify undo available
-        self.assertTrue(undo_manager.can_undo())
-        self.assertEqual(undo_manager.get_undo_count(), 1)
-
-        # Undo
-        reverted = undo_manager.undo()
-        self.assertIsNotNone(reverted)
-        self.assertEqual(len(reverted["assignments"]["2025-W43"]["monday"]), 0)
-
     def test_data_manager_with_lock_manager(self) -> None:
         """Test DataManager with LockManager file locking."""
         lock_manager = LockManager(self.temp_dir.name)
@@ -150,42 +127,20 @@ class TestDataLogicIntegration(unittest.TestCase):
     def test_complete_assignment_workflow(self) -> None:
         """Test complete workflow: create data → validate → assign → save."""
         # Create floorplan
-        data = self.data_manager.load_data()
+        data = copy.deepcopy(_EMPTY_TEMPLATE)
         room = Room(id="r1", name="Classroom", x=50, y=50, width=400, height=300)
-        data["floorplan"]["rooms"] = [{
-            "id": room.id,
-            "name": room.name,
-            "x": room.x,
-            "y": room.y,
-            "width": room.width,
-            "height": room.height
-        }]
+        data["floorplan"]["rooms"] = [room.to_dict()]
 
         # Add seats
-        seats_data = []
-        seats = []
-        for i in range(3):
-            seat = Seat(id=f"s{i}", room_id="r1", number=i+1, x=60+i*20, y=60)
-            seats.append(seat)
-            seats_data.append({
-                "id": seat.id,
-                "room_id": seat.room_id,
-                "number": seat.number,
-                "x": seat.x,
-                "y": seat.y
-            })
-        data["floorplan"]["seats"] = seats_data
+        seats = [Seat(id=f"s{i}", room_id="r1", number=i+1, x=60+i*20, y=60) for i in range(3)]
+        data["floorplan"]["seats"] = [s.to_dict() for s in seats]
 
         # Add students
         students = [
             Student(id="st1", name="Alice", weekly_pattern={"monday": True}),
             Student(id="st2", name="Bob", weekly_pattern={"monday": True}),
         ]
-        data["students"] = [{
-            "id": s.id,
-            "name": s.name,
-            "weekly_pattern": s.weekly_pattern
-        } for s in students]
+        data["students"] = [s.to_dict() for s in students]
 
         # Validate
         is_valid, errors = self.data_manager.validate_data(data)
@@ -202,10 +157,7 @@ class TestDataLogicIntegration(unittest.TestCase):
 
         # Save assignments
         data["assignments"]["2025-W43"] = {
-            "monday": [
-                {"student_id": a.student_id, "seat_id": a.seat_id}
-                for a in assignments
-            ]
+            "monday": [a.to_persist_dict() for a in assignments]
         }
 
         # Save to file
@@ -222,18 +174,94 @@ class TestMultiStepWorkflow(unittest.TestCase):
 
     def setUp(self) -> None:
         """Set up test fixtures."""
-        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_dir = tempfile.TemporaryDirectory(dir=_TMP_ROOT)
         self.data_manager = DataManager(self.temp_dir.name)
-        self.undo_manager = UndoManager()
 
     def tearDown(self) -> None:
         """Clean up test fixtures."""
         self.temp_dir.cleanup()
 
+    def test_multiple_assignments_persist(self) -> None:
+        """Test that multiple day assignments persist correctly."""
+        data = copy.deepcopy(_EMPTY_TEMPLATE)
+
+        # Create students and seats
+        students = [
+            Student(id="st1", name="Alice", weekly_pattern={
+                "monday": True, "tuesday": True, "wednesday": True
+            }),
+            Student(id="st2", name="Bob", weekly_pattern={
+                "monday": True, "tuesday": True, "wednesday": False
+            }),
+        ]
+        seats = [
+            Seat(id="s1", room_id="r1", number=1, x=0, y=0),
+            Seat(id="s2", room_id="r1", number=2, x=10, y=0),
+        ]
+
+        # Assign for each day
+        assignments_dict = {}
+        for day in ["monday", "tuesday", "wednesday"]:
+            assignments, conflicts = AssignmentEngine.assign_day(
+                students=students,
+                seats=seats,
+                day=day,
+                week="2025-W43"
+            )
+            assignments_dict[day] = assignments
+
+        # Verify assignments
+        self.assertEqual(len(assignments_dict["monday"]), 2)
+        self.assertEqual(len(assignments_dict["tuesday"]), 2)
+        self.assertEqual(len(assignments_dict["wednesday"]), 1)  # Only Alice
+
+        # Save to data manager
+        data["assignments"]["2025-W43"] = {
+            day: [a.to_persist_dict() for a in day_assignments]
+            for day, day_assignments in assignments_dict.items()
+        }
+        self.data_manager.save_data(data, create_backup=False)
+
+        # Load and verify
+        loaded = self.data_manager.load_data()
+        self.assertEqual(len(loaded["assignments"]["2025-W43"]["wednesday"]), 1)
+
+
+class TestUndoManagerIntegration(unittest.TestCase):
+    """Test UndoManager with assignment state (no disk access needed)."""
+
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        self.undo_manager = UndoManager()
+
+    def test_undo_manager_with_assignment_changes(self) -> None:
+        """Test UndoManager tracks assignment changes."""
+        # Create initial state
+        state1 = {
+            "assignments": {"2025-W43": {"monday": []}},
+            "timestamp": _FIXED_TS
+        }
+        self.undo_manager.push_state(state1)
+
+        # Modify state
+        state2 = {
+            "assignments": {"2025-W43": {"monday": [{"student_id": "st1", "seat_id": "s1"}]}},
+            "timestamp": _FIXED_TS
+        }
+        self.undo_manager.push_state(state2)
+
+        # Verify undo available
+        self.assertTrue(self.undo_manager.can_undo())
+        self.assertEqual(self.undo_manager.get_undo_count(), 1)
+
+        # Undo
+        reverted = self.undo_manager.undo()
+        self.assertIsNotNone(reverted)
+        self.assertEqual(len(reverted["assignments"]["2025-W43"]["monday"]), 0)
+
     def test_create_assign_undo_workflow(self) -> None:
         """Test: Create → Assign → Undo → Verify state."""
         # Step 1: Create data
-        data = self.data_manager.load_data()
         students = [
             Student(id="st1", name="Alice", weekly_pattern={"monday": True}),
             Student(id="st2", name="Bob", weekly_pattern={"monday": True}),
@@ -280,51 +308,39 @@ class TestMultiStepWorkflow(unittest.TestCase):
         self.assertIn("assignments", reverted)
         self.assertEqual(len(reverted["assignments"]), 0)
 
-    def test_multiple_assignments_persist(self) -> None:
-        """Test that multiple day assignments persist correctly."""
-        data = self.data_manager.load_data()
 
-        # Create students and seats
-        students = [
-            Student(id="st1", name="Alice", weekly_pattern={
-                "monday": True, "tuesday": True, "wednesday": True
-            }),
-            Student(id="st2", name="Bob", weekly_pattern={
-                "monday": True, "tuesday": True, "wednesday": False
-            }),
-        ]
-        seats = [
-            Seat(id="s1", room_id="r1", number=1, x=0, y=0),
-            Seat(id="s2", room_id="r1", number=2, x=10, y=0),
-        ]
+class TestDataValidationIntegration(unittest.TestCase):
+    """Test DataManager validation of in-memory data.
 
-        # Assign for each day
-        assignments_dict = {}
-        for day in ["monday", "tuesday", "wednesday"]:
-            assignments, conflicts = AssignmentEngine.assign_day(
-                students=students,
-                seats=seats,
-                day=day,
-                week="2025-W43"
-            )
-            assignments_dict[day] = [(a.student_id, a.seat_id) for a in assignments]
+    These tests never write to disk, so one temp directory is shared by the
+    whole class instead of being created for every test.
+    """
 
-        # Verify assignments
-        self.assertEqual(len(assignments_dict["monday"]), 2)
-        self.assertEqual(len(assignments_dict["tuesday"]), 2)
-        self.assertEqual(len(assignments_dict["wednesday"]), 1)  # Only Alice
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Set up shared test fixtures."""
+        cls.temp_dir = tempfile.TemporaryDirectory(dir=_TMP_ROOT)
+        cls.data_manager = DataManager(cls.temp_dir.name)
 
-        # Save to data manager
-        data["assignments"]["2025-W43"] = {
-            "monday": [{"student_id": s, "seat_id": st} for s, st in assignments_dict["monday"]],
-            "tuesday": [{"student_id": s, "seat_id": st} for s, st in assignments_dict["tuesday"]],
-            "wednesday": [{"student_id": s, "seat_id": st} for s, st in assignments_dict["wednesday"]],
-        }
-        self.data_manager.save_data(data, create_backup=False)
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """Clean up shared test fixtures."""
+        cls.temp_dir.cleanup()
 
-        # Load and verify
-        loaded = self.data_manager.load_data()
-        self.assertEqual(len(loaded["assignments"]["2025-W43"]["wednesday"]), 1)
+    def test_validator_with_loaded_data(self) -> None:
+        """Test Validator validates loaded data correctly."""
+        # Create valid data
+        data = copy.deepcopy(_EMPTY_TEMPLATE)
+        data["floorplan"]["rooms"] = [
+            {"id": "r1", "name": "Room A", "x": 50, "y": 50, "width": 400, "height": 300}
+        ]
+        data["floorplan"]["seats"] = [
+            {"id": "s1", "room_id": "r1", "number": 1, "x": 60, "y": 60}
+        ]
+
+        # Validate
+        is_valid, errors = self.data_manager.validate_data(data)
+        self.assertTrue(is_valid)
 
 
 class TestDataIntegrity(unittest.TestCase):
@@ -332,7 +348,7 @@ class TestDataIntegrity(unittest.TestCase):
 
     def setUp(self) -> None:
         """Set up test fixtures."""
-        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_dir = tempfile.TemporaryDirectory(dir=_TMP_ROOT)
         self.data_manager = DataManager(self.temp_dir.name)
 
     def tearDown(self) -> None:
@@ -342,27 +358,13 @@ class TestDataIntegrity(unittest.TestCase):
     def test_data_survives_save_load_cycle(self) -> None:
         """Test that complex data structures survive save/load."""
         # Create comprehensive data
-        data = self.data_manager._create_empty_data()
+        data = copy.deepcopy(_EMPTY_TEMPLATE)
         data["floorplan"]["rooms"] = [
             {"id": "r1", "name": "Classroom A", "x": 0, "y": 0, "width": 500, "height": 400},
             {"id": "r2", "name": "Classroom B", "x": 600, "y": 0, "width": 500, "height": 400}
         ]
-        data["floorplan"]["seats"] = [
-            {"id": f"s{i}", "room_id": f"r{(i % 2) + 1}", "number": i, "x": i*20, "y": 0}
-            for i in range(10)
-        ]
-        data["students"] = [
-            {
-                "id": f"st{i}",
-                "name": f"Student {i}",
-                "weekly_pattern": {
-                    "monday": i % 2 == 0,
-                    "tuesday": i % 3 == 0,
-                    "wednesday": True
-                }
-            }
-            for i in range(5)
-        ]
+        data["floorplan"]["seats"] = copy.deepcopy(_SEATS_FIXTURE)
+        data["students"] = copy.deepcopy(_STUDENTS_FIXTURE)
 
         # Save
         self.data_manager.save_data(data, create_backup=False)
@@ -380,7 +382,7 @@ class TestDataIntegrity(unittest.TestCase):
     def test_backup_contains_exact_copy(self) -> None:
         """Test that backup contains exact copy of original data."""
         # Create data
-        data = self.data_manager._create_empty_data()
+        data = copy.deepcopy(_EMPTY_TEMPLATE)
         data["test_key"] = "test_value"
         self.data_manager.save_data(data, create_backup=False)
 
@@ -388,8 +390,7 @@ class TestDataIntegrity(unittest.TestCase):
         backup_file = self.data_manager.backup_data()
 
         # Load backup
-        with open(backup_file, 'r') as f:
-            backup_data = json.load(f)
+        backup_data = json.loads(Path(backup_file).read_bytes())
 
         # Verify
         self.assertEqual(backup_data["test_key"], "test_value")
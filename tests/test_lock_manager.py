@@ -1,8 +1,11 @@
 """Unit tests for LockManager."""
 
+import json
 import unittest
+from unittest.mock import patch
 import tempfile
-import time
+import uuid
+from datetime import datetime, timedelta
 from pathlib import Path
 import sys
 
@@ -15,16 +18,25 @@ from data.lock_manager import LockManager
 class TestLockManager(unittest.TestCase):
     """Tests for LockManager class."""
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Create one temporary root directory shared by all tests."""
+        cls.temp_root = tempfile.TemporaryDirectory()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """Remove the shared temporary root directory."""
+        cls.temp_root.cleanup()
+
     def setUp(self) -> None:
-        """Set up test fixtures with temporary directory."""
-        self.temp_dir = tempfile.TemporaryDirectory()
-        self.lock_manager = LockManager(self.temp_dir.name)
+        """Set up test fixtures in a fresh subdirectory of the shared root."""
+        self.lock_dir = Path(self.temp_root.name) / uuid.uuid4().hex
+        self.lock_dir.mkdir()
+        self.lock_manager = LockManager(str(self.lock_dir))
 
     def tearDown(self) -> None:
-        """Clean up temporary directory."""
-        if self.lock_manager.lock_file.exists():
-            self.lock_manager.release_lock()
-        self.temp_dir.cleanup()
+        """Release any lock left behind by the test."""
+        self.lock_manager.release_lock()
 
     def test_initialization(self) -> None:
         """Test LockManager initialization."""
@@ -45,7 +57,7 @@ class TestLockManager(unittest.TestCase):
         self.lock_manager.acquire_lock("user1@PC-01")
 
         # Second manager tries to acquire
-        lock_manager2 = LockManager(self.temp_dir.name)
+        lock_manager2 = LockManager(str(self.lock_dir))
         success, existing_lock = lock_manager2.acquire_lock("user2@PC-02")
 
         self.assertFalse(success)
@@ -69,7 +81,7 @@ class TestLockManager(unittest.TestCase):
         self.assertFalse(self.lock_manager.is_locked())  # Own lock doesn't count
 
         # Different manager sees lock
-        lock_manager2 = LockManager(self.temp_dir.name)
+        lock_manager2 = LockManager(str(self.lock_dir))
         self.assertTrue(lock_manager2.is_locked())
 
     def test_get_lock_info(self) -> None:
@@ -92,43 +104,63 @@ class TestLockManager(unittest.TestCase):
         self.lock_manager.acquire_lock("user@PC-01")
 
         # Manually modify timestamp to be old
-        import json
-        with open(self.lock_manager.lock_file, 'r') as f:
-            lock_data = json.load(f)
+        lock_data = json.loads(self.lock_manager.lock_file.read_text(encoding='utf-8'))
 
         # Set timestamp to 2 hours ago (beyond 1 hour timeout)
-        from datetime import datetime, timedelta
         old_time = (datetime.utcnow() - timedelta(hours=2)).isoformat() + "Z"
         lock_data["timestamp"] = old_time
+        # Timestamps only decide for other hosts; a live flock here always wins
+        lock_data["hostname"] = "other-host.invalid"
 
-        with open(self.lock_manager.lock_file, 'w') as f:
-            json.dump(lock_data, f)
+        self.lock_manager.lock_file.write_text(json.dumps(lock_data), encoding='utf-8')
 
         # Now the stale lock should be removed when another process tries to acquire
-        lock_manager2 = LockManager(self.temp_dir.name)
+        lock_manager2 = LockManager(str(self.lock_dir))
         success, existing_lock = lock_manager2.acquire_lock("user2@PC-02")
 
         self.assertTrue(success)  # Should succeed because old lock is stale
         self.assertTrue(lock_manager2.lock_file.exists())
 
+    def test_acquire_lock_without_fcntl(self) -> None:
+        """Test the exclusive-create path used where fcntl is unavailable."""
+        with patch("data.lock_manager.FCNTL_AVAILABLE", False):
+            success, _ = self.lock_manager.acquire_lock("user1@PC-01")
+            self.assertTrue(success)
+
+            # The file already exists, so a second exclusive create must fail
+            lock_manager2 = LockManager(str(self.lock_dir))
+            success, existing_lock = lock_manager2.acquire_lock("user2@PC-02")
+            self.assertFalse(success)
+            self.assertEqual(existing_lock["user"], "user1@PC-01")
+
+            # A stale lock is removed and recreated by the new owner
+            lock_data = json.loads(self.lock_manager.lock_file.read_text(encoding='utf-8'))
+            lock_data["timestamp"] = (datetime.utcnow() - timedelta(hours=2)).isoformat() + "Z"
+            self.lock_manager.lock_file.write_text(json.dumps(lock_data), encoding='utf-8')
+
+            success, _ = lock_manager2.acquire_lock("user2@PC-02")
+            self.assertTrue(success)
+            self.assertEqual(lock_manager2.get_lock_info()["user"], "user2@PC-02")
+
     def test_update_lock_timestamp(self) -> None:
         """Test updating lock timestamp for heartbeat."""
-        self.lock_manager.acquire_lock("user@PC-01")
+        acquired_at = datetime(2025, 1, 1, 12, 0, 0)
+        updated_at = datetime(2025, 1, 1, 12, 5, 0)
 
-        import json
-        with open(self.lock_manager.lock_file, 'r') as f:
-            original_lock = json.load(f)
-        original_time = original_lock["timestamp"]
+        # Inject the clock instead of sleeping until the timestamp changes
+        with patch("data.lock_manager.datetime") as mock_datetime:
+            mock_datetime.utcnow.side_effect = [acquired_at, updated_at]
 
-        time.sleep(0.1)
-        updated = self.lock_manager.update_lock_timestamp()
-        self.assertTrue(updated)
+            self.lock_manager.acquire_lock("user@PC-01")
+            original_lock = json.loads(self.lock_manager.lock_file.read_text(encoding='utf-8'))
+
+            updated = self.lock_manager.update_lock_timestamp()
+            self.assertTrue(updated)
 
-        with open(self.lock_manager.lock_file, 'r') as f:
-            updated_lock = json.load(f)
-        updated_time = updated_lock["timestamp"]
+        updated_lock = json.loads(self.lock_manager.lock_file.read_text(encoding='utf-8'))
 
-        self.assertNotEqual(original_time, updated_time)
+        self.assertEqual(original_lock["timestamp"], acquired_at.isoformat() + "Z")
+        self.assertEqual(updated_lock["timestamp"], updated_at.isoformat() + "Z")
 
     def test_update_lock_without_lock(self) -> None:
         """Test updating lock when no lock exists."""
@@ -7,9 +7,10 @@ from models import Room, Seat, Student, Assignment
 class TestRoom(unittest.TestCase):
     """Tests for Room model."""
 
-    def setUp(self) -> None:
-        """Set up test fixtures."""
-        self.room = Room(
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Set up shared test fixtures (not mutated by any test)."""
+        cls.room = Room(
             id="room_001",
             name="Klassenraum A",
             x=50,
@@ -29,24 +30,20 @@ class TestRoom(unittest.TestCase):
         self.assertEqual(self.room.height, 300)
         self.assertEqual(self.room.color, "#1e3a5f")
 
-    def test_contains_point_inside(self) -> None:
-        """Test point inside room is correctly detected."""
-        self.assertTrue(self.room.contains_point(100, 100))
-        self.assertTrue(self.room.contains_point(200, 200))
-        self.assertTrue(self.room.contains_point(450, 350))
-
-    def test_contains_point_outside(self) -> None:
-        """Test point outside room is correctly detected."""
-        self.assertFalse(self.room.contains_point(0, 0))
-        self.assertFalse(self.room.contains_point(500, 400))
-        self.assertFalse(self.room.contains_point(100, 400))
-
-    def test_contains_point_boundary(self) -> None:
-        """Test boundary points are correctly detected."""
-        # Bottom-left corner
-        self.assertTrue(self.room.contains_point(50, 50))
-        # Top-right corner
-        self.assertTrue(self.room.contains_point(450, 350))
+    def test_contains_point(self) -> None:
+        """Test points inside, outside and on the boundary are correctly detected."""
+        cases = [
+            ((100, 100), True),   # inside
+            ((200, 200), True),   # inside
+            ((0, 0), False),      # outside
+            ((500, 400), False),  # outside
+            ((100, 400), False),  # outside
+            ((50, 50), True),     # bottom-left corner
+            ((450, 350), True),   # top-right corner
+        ]
+        for (x, y), expected in cases:
+            with self.subTest(point=(x, y)):
+                self.assertEqual(self.room.contains_point(x, y), expected)
 
     def test_room_to_dict(self) -> None:
         """Test room can be converted to dictionary."""
@@ -79,9 +76,10 @@ class TestRoom(unittest.TestCase):
 class TestSeat(unittest.TestCase):
     """Tests for Seat model."""
 
-    def setUp(self) -> None:
-        """Set up test fixtures."""
-        self.seat = Seat(
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Set up shared test fixtures (not mutated by any test)."""
+        cls.seat = Seat(
             id="seat_001",
             room_id="room_001",
             number=1,
@@ -134,9 +132,10 @@ class TestSeat(unittest.TestCase):
 class TestStudent(unittest.TestCase):
     """Tests for Student model."""
 
-    def setUp(self) -> None:
-        """Set up test fixtures."""
-        self.student = Student(
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Set up shared test fixtures (not mutated by any test)."""
+        cls.student = Student(
             id="student_001",
             name="Alice Schmidt",
             weekly_pattern={
@@ -184,6 +183,38 @@ class TestStudent(unittest.TestCase):
         self.assertEqual(student_dict["valid_from"], "2025-10-01")
         self.assertIn("near_window", student_dict["requirements"])
 
+    def test_student_weekly_pattern_is_shared(self) -> None:
+        """Test equal weekly patterns share one read-only object."""
+        first = Student(id="a", name="A", weekly_pattern={"monday": True})
+        second = Student(id="b", name="B", weekly_pattern={"monday": True})
+        self.assertIs(first.weekly_pattern, second.weekly_pattern)
+        self.assertEqual(first.weekly_pattern, {"monday": True})
+
+        with self.assertRaises(TypeError):
+            first.weekly_pattern["tuesday"] = True
+        self.assertIs(type(first.to_dict()["weekly_pattern"]), dict)
+
+    def test_student_weekly_pattern_reassignment_is_shared(self) -> None:
+        """Test assigning a new weekly_pattern also yields the shared object."""
+        first = Student(id="a", name="A", weekly_pattern={"monday": True})
+        second = Student(id="b", name="B", weekly_pattern={"tuesday": True})
+        second.weekly_pattern = {"monday": True}
+        self.assertIs(second.weekly_pattern, first.weekly_pattern)
+        with self.assertRaises(TypeError):
+            second.weekly_pattern["friday"] = True
+
+    def test_student_pattern_bits(self) -> None:
+        """Test pattern_bits mirrors weekly_pattern as a DAY_BITS mask."""
+        # monday, tuesday, thursday, friday
+        self.assertEqual(self.student.pattern_bits, 1 | 2 | 8 | 16)
+        self.assertEqual(Student(id="x", name="X", weekly_pattern={}).pattern_bits, 0)
+
+        student = Student(id="x", name="X", weekly_pattern={"monday": True})
+        student.weekly_pattern = {"sunday": True}
+        self.assertEqual(student.pattern_bits, 64)
+        with self.assertRaises(AttributeError):
+            student.pattern_bits = 1
+
     def test_student_from_dict(self) -> None:
         """Test student can be created from dictionary."""
         data = {
@@ -203,9 +234,10 @@ class TestStudent(unittest.TestCase):
 class TestAssignment(unittest.TestCase):
     """Tests for Assignment model."""
 
-    def setUp(self) -> None:
-        """Set up test fixtures."""
-        self.assignment = Assignment(
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Set up shared test fixtures (not mutated by any test)."""
+        cls.assignment = Assignment(
             student_id="student_001",
             seat_id="seat_001",
             day="monday",
@@ -238,6 +270,30 @@ class TestAssignment(unittest.TestCase):
         self.assertEqual(assignment_dict["day"], "monday")
         self.assertEqual(assignment_dict["week"], "2025-W43")
 
+    def test_assignment_to_persist_dict(self) -> None:
+        """Test assignment can be converted to its stored per-day form."""
+        self.assertEqual(
+            self.assignment.to_persist_dict(),
+            {"student_id": "student_001", "seat_id": "seat_001"}
+        )
+
+    def test_assignment_ids_are_interned(self) -> None:
+        """Test equal IDs built at runtime end up as one string object."""
+        # Joined at runtime so the literals are not already shared
+        first = Assignment(student_id="".join(["student_", "007"]), seat_id="seat_007",
+                           day="monday", week="2025-W43")
+        second = Assignment(student_id="".join(["student_", "007"]), seat_id="seat_007",
+                            day="tuesday", week="2025-W43")
+        self.assertIs(first.student_id, second.student_id)
+
+    def test_numeric_ids_are_accepted(self) -> None:
+        """Test non-string IDs are left as they are instead of interned."""
+        self.assertEqual(Room(id=1, name="R", x=0, y=0, width=1, height=1).id, 1)
+        self.assertEqual(Seat(id=2, room_id=1, number=1, x=0, y=0).room_id, 1)
+        self.assertEqual(Student(id=3, name="S").id, 3)
+        self.assertEqual(Assignment(student_id=3, seat_id=2, day="monday",
+                                    week="2025-W43").seat_id, 2)
+
     def test_assignment_from_dict(self) -> None:
         """Test assignment can be created from dictionary."""
         data = {
@@ -11,22 +11,37 @@ Tests file locking and concurrent access scenarios:
 import unittest
 import tempfile
 import json
+import os
+import socket
 import time
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Tuple, Optional, Dict, Any
+from unittest.mock import patch
 
-from data.lock_manager import LockManager
+from data.lock_manager import LockManager, FCNTL_AVAILABLE
 from data.data_manager import DataManager
-from config import LOCK_TIMEOUT_SECONDS
+from config import LOCK_FILE, LOCK_TIMEOUT_SECONDS
+from tests import _TMP_ROOT
 
 
 class TestLockAcquisition(unittest.TestCase):
     """Test basic lock acquisition and release."""
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Create one directory shared by all tests in the class."""
+        cls.temp_dir = tempfile.TemporaryDirectory(dir=_TMP_ROOT)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """Remove the shared directory."""
+        cls.temp_dir.cleanup()
+
     def setUp(self) -> None:
         """Set up test fixtures."""
-        self.temp_dir = tempfile.TemporaryDirectory()
+        # Only the lock file carries state between tests
+        (Path(self.temp_dir.name) / LOCK_FILE).unlink(missing_ok=True)
         self.lock_manager = LockManager(self.temp_dir.name)
 
     def tearDown(self) -> None:
@@ -36,7 +51,6 @@ class TestLockAcquisition(unittest.TestCase):
             self.lock_manager.release_lock()
         except:
             pass
-        self.temp_dir.cleanup()
 
     def test_acquire_lock_success(self) -> None:
         """Test successful lock acquisition."""
@@ -90,7 +104,7 @@ class TestConcurrentAccess(unittest.TestCase):
 
     def setUp(self) -> None:
         """Set up test fixtures."""
-        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_dir = tempfile.TemporaryDirectory(dir=_TMP_ROOT)
         self.lock_manager1 = LockManager(self.temp_dir.name)
         self.lock_manager2 = LockManager(self.temp_dir.name)
 
@@ -135,6 +149,21 @@ class TestConcurrentAccess(unittest.TestCase):
         data2 = data_manager2.load_data()
         self.assertIsNotNone(data2)
 
+    def test_concurrent_readers_leave_write_lock_intact(self) -> None:
+        """Test that several readers can load while a writer holds the lock."""
+        writer = DataManager(self.temp_dir.name)
+        self.lock_manager1.acquire_lock("user1@pc01")
+        writer.save_data(writer.load_data(), create_backup=False)
+
+        readers = [DataManager(self.temp_dir.name) for _ in range(3)]
+        for reader in readers:
+            self.assertIsNotNone(reader.load_data())
+
+        # Reads take no lock, so the writer still holds it exclusively
+        self.assertFalse(self.lock_manager1.is_locked())
+        self.assertTrue(self.lock_manager2.is_locked())
+        self.assertEqual(self.lock_manager2.get_lock_info()["user"], "user1@pc01")
+
     def test_lock_release_allows_new_acquisition(self) -> None:
         """Test that releasing lock allows another instance to acquire it."""
         # First instance acquires and releases
@@ -154,9 +183,20 @@ class TestConcurrentAccess(unittest.TestCase):
 class TestStaleLockDetection(unittest.TestCase):
     """Test stale lock detection and cleanup."""
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Create one directory shared by all tests in the class."""
+        cls.temp_dir = tempfile.TemporaryDirectory(dir=_TMP_ROOT)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """Remove the shared directory."""
+        cls.temp_dir.cleanup()
+
     def setUp(self) -> None:
         """Set up test fixtures."""
-        self.temp_dir = tempfile.TemporaryDirectory()
+        # Only the lock file carries state between tests
+        (Path(self.temp_dir.name) / LOCK_FILE).unlink(missing_ok=True)
         self.lock_manager = LockManager(self.temp_dir.name)
 
     def tearDown(self) -> None:
@@ -165,7 +205,6 @@ class TestStaleLockDetection(unittest.TestCase):
             self.lock_manager.release_lock()
         except:
             pass
-        self.temp_dir.cleanup()
 
     def test_detect_stale_lock(self) -> None:
         """Test detecting stale lock from crashed process."""
@@ -206,6 +245,111 @@ class TestStaleLockDetection(unittest.TestCase):
         self.assertTrue(success)
         self.assertIsNone(lock_info)
 
+    @unittest.skipUnless(FCNTL_AVAILABLE, "fcntl not available")
+    def test_dead_holder_on_same_host_detected_immediately(self) -> None:
+        """Test that a fresh lock without a live flock holder is taken over."""
+        # Fresh lock from this machine whose process is gone (no flock held)
+        lock_file = Path(self.temp_dir.name) / "data.lock"
+        lock_data = {
+            "locked": True,
+            "user": "crashed_user@pc01",
+            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "pid": 9999,
+            "hostname": socket.gethostname()
+        }
+        with open(lock_file, 'w') as f:
+            json.dump(lock_data, f)
+
+        self.assertFalse(self.lock_manager.is_locked())
+
+        success, lock_info = self.lock_manager.acquire_lock("new_user@pc01")
+        self.assertTrue(success)
+        self.assertIsNone(lock_info)
+
+    @unittest.skipUnless(FCNTL_AVAILABLE, "fcntl not available")
+    def test_stale_lock_with_live_holder_on_same_host_blocks(self) -> None:
+        """Test that an old timestamp never overrides a live flock holder here."""
+        import fcntl
+
+        lock_file = Path(self.temp_dir.name) / "data.lock"
+        lock_data = {
+            "locked": True,
+            "user": "busy_user@pc01",
+            "timestamp": (datetime.utcnow() - timedelta(hours=2)).isoformat() + "Z",
+            "pid": 9999,
+            "hostname": socket.gethostname()
+        }
+        with open(lock_file, 'w') as holder:
+            json.dump(lock_data, holder)
+            holder.flush()
+            fcntl.flock(holder.fileno(), fcntl.LOCK_EX)
+
+            # Status queries agree with acquire_lock: the flock, not the age, decides
+            self.assertTrue(self.lock_manager.is_locked())
+            self.assertEqual(self.lock_manager.get_lock_info()["user"], "busy_user@pc01")
+            self.assertFalse(self.lock_manager.is_stale_lock())
+
+            success, lock_info = self.lock_manager.acquire_lock("new_user@pc01")
+
+            self.assertFalse(success)
+            self.assertEqual(lock_info["user"], "busy_user@pc01")
+            self.assertTrue(lock_file.exists())
+
+    @unittest.skipUnless(FCNTL_AVAILABLE, "fcntl not available")
+    def test_briefly_probed_lock_is_retried(self) -> None:
+        """Test that an is_locked() probe racing acquisition does not make it fail."""
+        import fcntl
+
+        lock_file = Path(self.temp_dir.name) / "data.lock"
+        dead_holder = json.dumps({
+            "locked": True,
+            "user": "crashed_user@pc01",
+            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "pid": 9999,
+            "hostname": socket.gethostname()
+        })
+        for description, contents in [("empty", ""), ("dead same-host holder", dead_holder)]:
+            with self.subTest(description):
+                lock_file.write_text(contents, encoding='utf-8')
+                probe = os.open(lock_file, os.O_RDONLY)
+                fcntl.flock(probe, fcntl.LOCK_SH)
+                probes = [probe]
+
+                def end_probe(_seconds: float) -> None:
+                    # The probe ends during the first back-off, deterministically
+                    while probes:
+                        os.close(probes.pop())
+
+                try:
+                    with patch("data.lock_manager.time.sleep", side_effect=end_probe) as sleep:
+                        success, lock_info = self.lock_manager.acquire_lock("new_user@pc01")
+                finally:
+                    end_probe(0)
+
+                self.assertTrue(success)
+                self.assertIsNone(lock_info)
+                sleep.assert_called_once()
+                self.lock_manager.release_lock()
+
+    def test_fresh_lock_from_other_host_blocks(self) -> None:
+        """Test that a fresh lock written from another machine is respected."""
+        lock_file = Path(self.temp_dir.name) / "data.lock"
+        lock_data = {
+            "locked": True,
+            "user": "remote_user@pc02",
+            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "pid": 9999,
+            "hostname": "other-host.invalid"
+        }
+        with open(lock_file, 'w') as f:
+            json.dump(lock_data, f)
+
+        self.assertTrue(self.lock_manager.is_locked())
+
+        success, lock_info = self.lock_manager.acquire_lock("new_user@pc01")
+        self.assertFalse(success)
+        self.assertEqual(lock_info["user"], "remote_user@pc02")
+
     def test_lock_timeout_boundary(self) -> None:
         """Test lock timeout at boundary."""
         # Create lock at LOCK_TIMEOUT_SECONDS ago (should be stale)
@@ -234,9 +378,20 @@ class TestStaleLockDetection(unittest.TestCase):
 class TestLockCorruptionRecovery(unittest.TestCase):
     """Test recovery from lock file corruption."""
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Create one directory shared by all tests in the class."""
+        cls.temp_dir = tempfile.TemporaryDirectory(dir=_TMP_ROOT)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """Remove the shared directory."""
+        cls.temp_dir.cleanup()
+
     def setUp(self) -> None:
         """Set up test fixtures."""
-        self.temp_dir = tempfile.TemporaryDirectory()
+        # Only the lock file carries state between tests
+        (Path(self.temp_dir.name) / LOCK_FILE).unlink(missing_ok=True)
         self.lock_manager = LockManager(self.temp_dir.name)
 
     def tearDown(self) -> None:
@@ -245,7 +400,6 @@ class TestLockCorruptionRecovery(unittest.TestCase):
             self.lock_manager.release_lock()
         except:
             pass
-        self.temp_dir.cleanup()
 
     def test_corrupted_lock_file_recovery(self) -> None:
         """Test recovery from corrupted lock file."""
@@ -286,7 +440,7 @@ class TestMultiUserWorkflow(unittest.TestCase):
 
     def setUp(self) -> None:
         """Set up test fixtures."""
-        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_dir = tempfile.TemporaryDirectory(dir=_TMP_ROOT)
         self.data_manager1 = DataManager(self.temp_dir.name)
         self.data_manager2 = DataManager(self.temp_dir.name)
         self.lock_manager1 = LockManager(self.temp_dir.name)
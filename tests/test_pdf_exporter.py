@@ -16,10 +16,11 @@ from logic.pdf_exporter import PdfExporter, REPORTLAB_AVAILABLE
 from models.assignment import Assignment
 from models.student import Student
 from models.seat import Seat
+from config import WEEKDAY_ORDER
 
 
-class TestPdfExporter(unittest.TestCase):
-    """Test cases for the PdfExporter class."""
+class _PdfFixtureMixin:
+    """Shared sample week for the PdfExporter tests."""
 
     def setUp(self):
         """Set up test data."""
@@ -45,7 +46,11 @@ class TestPdfExporter(unittest.TestCase):
         }
         self.week = "2025-W43"
 
-    @unittest.skipUnless(REPORTLAB_AVAILABLE, "ReportLab not installed")
+
+@unittest.skipUnless(REPORTLAB_AVAILABLE, "ReportLab not installed")
+class TestPdfExporter(_PdfFixtureMixin, unittest.TestCase):
+    """Test cases for PDF generation with ReportLab installed."""
+
     def test_export_week_to_pdf_basic(self):
         """Test basic PDF generation with valid data."""
         pdf_content = PdfExporter.export_week_to_pdf(
@@ -60,11 +65,10 @@ class TestPdfExporter(unittest.TestCase):
         # Check PDF header magic bytes
         self.assertTrue(pdf_content.startswith(b'%PDF'))
 
-    @unittest.skipUnless(REPORTLAB_AVAILABLE, "ReportLab not installed")
     def test_export_week_to_pdf_empty_assignments(self):
         """Test PDF generation with no assignments."""
         empty_assignments = {
-            day: [] for day in ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+            day: [] for day in WEEKDAY_ORDER
         }
 
         pdf_content = PdfExporter.export_week_to_pdf(
@@ -78,7 +82,6 @@ class TestPdfExporter(unittest.TestCase):
         self.assertGreater(len(pdf_content), 0)
         self.assertTrue(pdf_content.startswith(b'%PDF'))
 
-    @unittest.skipUnless(REPORTLAB_AVAILABLE, "ReportLab not installed")
     def test_export_week_to_pdf_with_statistics(self):
         """Test PDF generation with statistics section."""
         statistics = {
@@ -103,7 +106,6 @@ class TestPdfExporter(unittest.TestCase):
         self.assertGreater(len(pdf_content), 0)
         self.assertTrue(pdf_content.startswith(b'%PDF'))
 
-    @unittest.skipUnless(REPORTLAB_AVAILABLE, "ReportLab not installed")
     def test_export_week_to_pdf_missing_student(self):
         """Test PDF generation with assignment referencing non-existent student."""
         assignments = {
@@ -123,7 +125,6 @@ class TestPdfExporter(unittest.TestCase):
         self.assertIsInstance(pdf_content, bytes)
         self.assertGreater(len(pdf_content), 0)
 
-    @unittest.skipUnless(REPORTLAB_AVAILABLE, "ReportLab not installed")
     def test_export_week_to_pdf_missing_seat(self):
         """Test PDF generation with assignment referencing non-existent seat."""
         assignments = {
@@ -143,7 +144,6 @@ class TestPdfExporter(unittest.TestCase):
         self.assertIsInstance(pdf_content, bytes)
         self.assertGreater(len(pdf_content), 0)
 
-    @unittest.skipUnless(REPORTLAB_AVAILABLE, "ReportLab not installed")
     def test_save_pdf_to_file(self):
         """Test saving PDF content to a file."""
         pdf_content = PdfExporter.export_week_to_pdf(
@@ -171,39 +171,11 @@ class TestPdfExporter(unittest.TestCase):
             if os.path.exists(tmp_path):
                 os.remove(tmp_path)
 
-    def test_save_pdf_to_file_invalid_path(self):
-        """Test saving PDF to invalid path raises error."""
-        pdf_content = b'%PDF-1.4\ntest'
-        invalid_path = '/nonexistent/directory/file.pdf'
-
-        with self.assertRaises(IOError):
-            PdfExporter.save_pdf_to_file(pdf_content, invalid_path)
-
-    def test_is_available(self):
-        """Test checking if PDF export is available."""
-        result = PdfExporter.is_available()
-        self.assertIsInstance(result, bool)
-        self.assertEqual(result, REPORTLAB_AVAILABLE)
-
-    @unittest.skipIf(REPORTLAB_AVAILABLE, "Test only when ReportLab is not available")
-    def test_export_without_reportlab(self):
-        """Test that export fails gracefully when ReportLab is not installed."""
-        with self.assertRaises(ImportError) as context:
-            PdfExporter.export_week_to_pdf(
-                week=self.week,
-                assignments=self.assignments,
-                students=self.students,
-                seats=self.seats
-            )
-        self.assertIn("ReportLab", str(context.exception))
-
-    @unittest.skipUnless(REPORTLAB_AVAILABLE, "ReportLab not installed")
     def test_export_week_to_pdf_all_days_with_assignments(self):
         """Test PDF generation with assignments on all days."""
         all_days_assignments = {}
-        days = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
 
-        for day in days:
+        for day in WEEKDAY_ORDER:
             all_days_assignments[day] = [
                 Assignment(student_id="st1", seat_id="s1", day=day, week="2025-W43"),
             ]
@@ -218,7 +190,6 @@ class TestPdfExporter(unittest.TestCase):
         self.assertIsInstance(pdf_content, bytes)
         self.assertGreater(len(pdf_content), 0)
 
-    @unittest.skipUnless(REPORTLAB_AVAILABLE, "ReportLab not installed")
     def test_export_week_to_pdf_german_characters(self):
         """Test PDF generation with German characters (umlauts)."""
         german_students = [
@@ -242,7 +213,6 @@ class TestPdfExporter(unittest.TestCase):
         self.assertIsInstance(pdf_content, bytes)
         self.assertGreater(len(pdf_content), 0)
 
-    @unittest.skipUnless(REPORTLAB_AVAILABLE, "ReportLab not installed")
     def test_export_week_to_pdf_large_dataset(self):
         """Test PDF generation with many assignments."""
         # Create 50 students and 50 seats
@@ -272,5 +242,52 @@ class TestPdfExporter(unittest.TestCase):
         self.assertGreater(len(pdf_content), 0)
 
 
+class TestPdfExporterAvailability(_PdfFixtureMixin, unittest.TestCase):
+    """Test cases that run whether or not ReportLab is installed."""
+
+    def test_save_pdf_to_file_invalid_path(self):
+        """Test saving PDF to invalid path raises error."""
+        pdf_content = b'%PDF-1.4\ntest'
+        invalid_path = '/nonexistent/directory/file.pdf'
+
+        with self.assertRaises(IOError):
+            PdfExporter.save_pdf_to_file(pdf_content, invalid_path)
+
+    def test_save_pdf_to_file_leaves_sibling_tmp_alone(self):
+        """Test saving a PDF never touches an existing same-named .tmp file."""
+        pdf_content = b'%PDF-1.4\ntest'
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            target = os.path.join(tmp_dir, "Woche.pdf")
+            sibling = os.path.join(tmp_dir, "Woche.tmp")
+            with open(sibling, 'wb') as f:
+                f.write(b'user data')
+
+            PdfExporter.save_pdf_to_file(pdf_content, target)
+
+            with open(target, 'rb') as f:
+                self.assertEqual(f.read(), pdf_content)
+            with open(sibling, 'rb') as f:
+                self.assertEqual(f.read(), b'user data')
+            self.assertEqual(sorted(os.listdir(tmp_dir)), ["Woche.pdf", "Woche.tmp"])
+
+    def test_is_available(self):
+        """Test checking if PDF export is available."""
+        result = PdfExporter.is_available()
+        self.assertIsInstance(result, bool)
+        self.assertEqual(result, REPORTLAB_AVAILABLE)
+
+    @unittest.skipIf(REPORTLAB_AVAILABLE, "Test only when ReportLab is not available")
+    def test_export_without_reportlab(self):
+        """Test that export fails gracefully when ReportLab is not installed."""
+        with self.assertRaises(ImportError) as context:
+            PdfExporter.export_week_to_pdf(
+                week=self.week,
+                assignments=self.assignments,
+                students=self.students,
+                seats=self.seats
+            )
+        self.assertIn("ReportLab", str(context.exception))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -2,6 +2,7 @@
 
 import unittest
 from pathlib import Path
+from types import MappingProxyType
 import sys
 
 # Add parent directory to path for imports
@@ -16,12 +17,13 @@ class TestUndoManager(unittest.TestCase):
     def setUp(self) -> None:
         """Set up test fixtures."""
         self.undo_manager = UndoManager(max_states=50)
-        self.sample_state = {
+        # Read-only template: tests derive variants with {**sample_state, ...}
+        self.sample_state = MappingProxyType({
             "floorplan": {"rooms": [], "seats": []},
             "students": [],
             "assignments": {},
             "metadata": {"last_user": "test"}
-        }
+        })
 
     def test_initialization(self) -> None:
         """Test UndoManager initialization."""
@@ -41,9 +43,8 @@ class TestUndoManager(unittest.TestCase):
 
     def test_push_multiple_states(self) -> None:
         """Test pushing multiple states."""
-        state1 = self.sample_state.copy()
-        state2 = self.sample_state.copy()
-        state2["students"] = ["student1"]
+        state1 = self.sample_state
+        state2 = {**self.sample_state, "students": ["student1"]}
 
         self.undo_manager.push_state(state1)
         self.undo_manager.push_state(state2)
@@ -68,9 +69,8 @@ class TestUndoManager(unittest.TestCase):
 
     def test_undo_operation(self) -> None:
         """Test undo operation."""
-        state1 = self.sample_state.copy()
-        state2 = self.sample_state.copy()
-        state2["students"] = ["student1"]
+        state1 = self.sample_state
+        state2 = {**self.sample_state, "students": ["student1"]}
 
         self.undo_manager.push_state(state1)
         self.undo_manager.push_state(state2)
@@ -89,9 +89,8 @@ class TestUndoManager(unittest.TestCase):
 
     def test_redo_operation(self) -> None:
         """Test redo operation."""
-        state1 = self.sample_state.copy()
-        state2 = self.sample_state.copy()
-        state2["students"] = ["student1"]
+        state1 = self.sample_state
+        state2 = {**self.sample_state, "students": ["student1"]}
 
         self.undo_manager.push_state(state1)
         self.undo_manager.push_state(state2)
@@ -141,13 +140,43 @@ class TestUndoManager(unittest.TestCase):
 
         # Push 10 states
         for i in range(10):
-            state = self.sample_state.copy()
-            state["students"] = [f"student{i}"]
-            undo_manager.push_state(state)
+            undo_manager.push_state({**self.sample_state, "students": [f"student{i}"]})
 
         # Should only keep 5 most recent
         self.assertEqual(len(undo_manager.undo_stack), 5)
 
+    def test_push_state_is_isolated_from_caller(self) -> None:
+        """Test in-place edits after push do not rewrite history."""
+        state = {
+            "floorplan": {"rooms": [], "seats": []},
+            "students": [],
+            "assignments": {},
+            "metadata": {"last_user": "test"}
+        }
+        self.undo_manager.push_state(state)
+        state["students"].append("student1")
+        self.undo_manager.push_state(state)
+
+        previous = self.undo_manager.undo()
+        self.assertEqual(previous["students"], [])
+
+        # Editing the returned state must not touch the stored snapshot
+        previous["students"].append("student2")
+        self.assertEqual(self.undo_manager.undo_stack[-1].students, [])
+
+    def test_push_state_shares_unchanged_sections(self) -> None:
+        """Test unchanged sections are shared with the previous snapshot."""
+        state1 = self.sample_state
+        state2 = {**self.sample_state, "students": ["student1"]}
+
+        self.undo_manager.push_state(state1)
+        self.undo_manager.push_state(state2)
+
+        first, second = self.undo_manager.undo_stack
+        self.assertIs(first.floorplan, second.floorplan)
+        self.assertIsNot(first.students, second.students)
+        self.assertIsNot(second.floorplan, state2["floorplan"])
+
     def test_state_to_dict(self) -> None:
         """Test StateSnapshot to_dict conversion."""
         snapshot = StateSnapshot(
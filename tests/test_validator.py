@@ -20,91 +20,53 @@ from models.assignment import Assignment
 class TestValidator(unittest.TestCase):
     """Test cases for the Validator class."""
 
-    def test_validate_room_overlap_no_overlap(self):
-        """Test that non-overlapping rooms are validated correctly."""
-        room1 = Room(id="room_001", name="Room A", x=0, y=0, width=100, height=100, color="#1e3a5f")
-        room2 = Room(id="room_002", name="Room B", x=150, y=0, width=100, height=100, color="#1e3a5f")
-
-        is_valid, conflicts = Validator.validate_room_overlap([room1, room2])
-
-        self.assertTrue(is_valid)
-        self.assertEqual(len(conflicts), 0)
-
-    def test_validate_room_overlap_with_overlap(self):
-        """Test that overlapping rooms are detected."""
-        room1 = Room(id="room_001", name="Room A", x=0, y=0, width=100, height=100, color="#1e3a5f")
-        room2 = Room(id="room_002", name="Room B", x=50, y=50, width=100, height=100, color="#1e3a5f")
-
-        is_valid, conflicts = Validator.validate_room_overlap([room1, room2])
-
-        self.assertFalse(is_valid)
-        self.assertEqual(len(conflicts), 1)
-        self.assertIn(("room_001", "room_002"), conflicts)
-
-    def test_validate_room_overlap_edge_touching(self):
-        """Test that rooms touching at edges are considered valid (not overlapping)."""
-        room1 = Room(id="room_001", name="Room A", x=0, y=0, width=100, height=100, color="#1e3a5f")
-        room2 = Room(id="room_002", name="Room B", x=100, y=0, width=100, height=100, color="#1e3a5f")
-
-        is_valid, conflicts = Validator.validate_room_overlap([room1, room2])
-
-        self.assertTrue(is_valid)
-        self.assertEqual(len(conflicts), 0)
-
-    def test_validate_room_overlap_multiple_overlaps(self):
-        """Test detection of multiple overlapping rooms."""
-        room1 = Room(id="room_001", name="Room A", x=0, y=0, width=100, height=100, color="#1e3a5f")
-        room2 = Room(id="room_002", name="Room B", x=50, y=50, width=100, height=100, color="#1e3a5f")
-        room3 = Room(id="room_003", name="Room C", x=75, y=75, width=100, height=100, color="#1e3a5f")
-
-        is_valid, conflicts = Validator.validate_room_overlap([room1, room2, room3])
-
-        self.assertFalse(is_valid)
-        # Should have 3 conflicts: 1-2, 1-3, 2-3
-        self.assertEqual(len(conflicts), 3)
-
-    def test_validate_room_overlap_empty_list(self):
-        """Test that empty room list is valid."""
-        is_valid, conflicts = Validator.validate_room_overlap([])
-
-        self.assertTrue(is_valid)
-        self.assertEqual(len(conflicts), 0)
-
-    def test_validate_seat_in_room_valid(self):
-        """Test that a seat within room bounds is valid."""
-        room = Room(id="room_001", name="Room A", x=0, y=0, width=100, height=100, color="#1e3a5f")
-        seat = Seat(id="seat_001", room_id="room_001", number=1, x=50, y=50, properties={})
-
-        is_valid = Validator.validate_seat_in_room(seat, room)
-
-        self.assertTrue(is_valid)
-
-    def test_validate_seat_in_room_outside_bounds(self):
-        """Test that a seat outside room bounds is invalid."""
-        room = Room(id="room_001", name="Room A", x=0, y=0, width=100, height=100, color="#1e3a5f")
-        seat = Seat(id="seat_001", room_id="room_001", number=1, x=150, y=150, properties={})
-
-        is_valid = Validator.validate_seat_in_room(seat, room)
-
-        self.assertFalse(is_valid)
-
-    def test_validate_seat_in_room_wrong_room_id(self):
-        """Test that a seat with wrong room_id is invalid."""
-        room = Room(id="room_001", name="Room A", x=0, y=0, width=100, height=100, color="#1e3a5f")
-        seat = Seat(id="seat_001", room_id="room_002", number=1, x=50, y=50, properties={})
-
-        is_valid = Validator.validate_seat_in_room(seat, room)
-
-        self.assertFalse(is_valid)
-
-    def test_validate_seat_in_room_on_edge(self):
-        """Test that a seat on the room edge is valid."""
-        room = Room(id="room_001", name="Room A", x=0, y=0, width=100, height=100, color="#1e3a5f")
-        seat = Seat(id="seat_001", room_id="room_001", number=1, x=100, y=100, properties={})
+    @classmethod
+    def setUpClass(cls):
+        """Build fixtures shared by all tests; validators never mutate them."""
+        cls.room_a = Room(id="room_001", name="Room A", x=0, y=0, width=100, height=100, color="#1e3a5f")
+        cls.seat_row = [
+            Seat(id="seat_001", room_id="room_001", number=1, x=0, y=0),
+            Seat(id="seat_002", room_id="room_001", number=2, x=10, y=0),
+            Seat(id="seat_003", room_id="room_001", number=3, x=20, y=0),
+        ]
 
-        is_valid = Validator.validate_seat_in_room(seat, room)
+    def test_validate_room_overlap(self):
+        """Test room overlap detection across layouts."""
+        def room_b(x, y):
+            return Room(id="room_002", name="Room B", x=x, y=y, width=100, height=100, color="#1e3a5f")
+
+        room_c = Room(id="room_003", name="Room C", x=75, y=75, width=100, height=100, color="#1e3a5f")
+        cases = [
+            # (description, rooms, expected conflicts)
+            ("no overlap", [self.room_a, room_b(150, 0)], []),
+            ("overlap", [self.room_a, room_b(50, 50)], [("room_001", "room_002")]),
+            # Rooms touching at edges are considered valid (not overlapping)
+            ("edge touching", [self.room_a, room_b(100, 0)], []),
+            ("multiple overlaps", [self.room_a, room_b(50, 50), room_c],
+             [("room_001", "room_002"), ("room_001", "room_003"), ("room_002", "room_003")]),
+            ("empty list", [], []),
+        ]
+        for description, rooms, expected in cases:
+            with self.subTest(description):
+                is_valid, conflicts = Validator.validate_room_overlap(rooms)
+
+                self.assertEqual(is_valid, not expected)
+                self.assertEqual(conflicts, expected)
+
+    def test_validate_seat_in_room(self):
+        """Test seat positioning against the room bounds and room_id."""
+        cases = [
+            # (description, seat room_id, x, y, expected)
+            ("inside", "room_001", 50, 50, True),
+            ("outside bounds", "room_001", 150, 150, False),
+            ("wrong room_id", "room_002", 50, 50, False),
+            ("on edge", "room_001", 100, 100, True),
+        ]
+        for description, room_id, x, y, expected in cases:
+            with self.subTest(description):
+                seat = Seat(id="seat_001", room_id=room_id, number=1, x=x, y=y, properties={})
 
-        self.assertTrue(is_valid)
+                self.assertEqual(Validator.validate_seat_in_room(seat, self.room_a), expected)
 
     def test_validate_capacity_sufficient(self):
         """Test capacity validation when there are enough seats."""
@@ -112,11 +74,7 @@ class TestValidator(unittest.TestCase):
             Student(id="s1", name="Alice", weekly_pattern={"monday": True}),
             Student(id="s2", name="Bob", weekly_pattern={"monday": True}),
         ]
-        seats = [
-            Seat(id="seat_001", room_id="room_001", number=1, x=0, y=0),
-            Seat(id="seat_002", room_id="room_001", number=2, x=10, y=0),
-            Seat(id="seat_003", room_id="room_001", number=3, x=20, y=0),
-        ]
+        seats = self.seat_row
 
         is_valid, details = Validator.validate_capacity(students, seats, "monday")
 
@@ -132,10 +90,7 @@ class TestValidator(unittest.TestCase):
             Student(id="s2", name="Bob", weekly_pattern={"monday": True}),
             Student(id="s3", name="Charlie", weekly_pattern={"monday": True}),
         ]
-        seats = [
-            Seat(id="seat_001", room_id="room_001", number=1, x=0, y=0),
-            Seat(id="seat_002", room_id="room_001", number=2, x=10, y=0),
-        ]
+        seats = self.seat_row[:2]
 
         is_valid, details = Validator.validate_capacity(students, seats, "monday")
 
@@ -144,15 +99,46 @@ class TestValidator(unittest.TestCase):
         self.assertEqual(details['seats_count'], 2)
         self.assertEqual(details['excess'], 1)
 
+    def test_validate_capacity_multiday_matches_single_day(self):
+        """Test that the multi-day check agrees with per-day validate_capacity."""
+        students = [
+            Student(id="s1", name="Alice", weekly_pattern={"monday": True, "tuesday": True}),
+            Student(id="s2", name="Bob", weekly_pattern={"monday": True, "tuesday": False}),
+            Student(id="s3", name="Charlie", weekly_pattern={"monday": True}),
+        ]
+        seats = self.seat_row[:2]
+        days = ["monday", "tuesday", "sunday"]
+
+        results = Validator.validate_capacity_multiday(students, seats, days)
+
+        self.assertEqual(list(results), days)
+        for day in days:
+            self.assertEqual(results[day], Validator.validate_capacity(students, seats, day))
+        self.assertFalse(results["monday"][0])
+        self.assertEqual(results["monday"][1]['excess'], 1)
+
+    def test_validate_capacity_after_weekly_pattern_reassignment(self):
+        """Test capacity validation sees a reassigned weekly_pattern."""
+        students = [
+            Student(id="s1", name="Alice", weekly_pattern={"monday": True}),
+            Student(id="s2", name="Bob", weekly_pattern={"tuesday": True}),
+        ]
+        seats = self.seat_row[:1]
+        students[1].weekly_pattern = {"monday": True}
+
+        is_valid, details = Validator.validate_capacity(students, seats, "monday")
+
+        self.assertFalse(is_valid)
+        self.assertEqual(details['students_count'], 2)
+        self.assertEqual(details['excess'], 1)
+
     def test_validate_capacity_no_students_available(self):
         """Test capacity validation when no students are available on the day."""
         students = [
             Student(id="s1", name="Alice", weekly_pattern={"monday": False}),
             Student(id="s2", name="Bob", weekly_pattern={"tuesday": True}),
         ]
-        seats = [
-            Seat(id="seat_001", room_id="room_001", number=1, x=0, y=0),
-        ]
+        seats = self.seat_row[:1]
 
         is_valid, details = Validator.validate_capacity(students, seats, "monday")
 
@@ -161,62 +147,28 @@ class TestValidator(unittest.TestCase):
         self.assertEqual(details['seats_count'], 1)
         self.assertEqual(details['excess'], 0)
 
-    def test_validate_student_date_range_valid(self):
-        """Test valid student date range."""
-        student = Student(
-            id="s1",
-            name="Alice",
-            valid_from="2025-01-01",
-            valid_until="2025-12-31"
-        )
-
-        is_valid, error = Validator.validate_student_date_range(student)
-
-        self.assertTrue(is_valid)
-        self.assertIsNone(error)
-
-    def test_validate_student_date_range_ongoing(self):
-        """Test student with 'ongoing' end date."""
-        student = Student(
-            id="s1",
-            name="Alice",
-            valid_from="2025-01-01",
-            valid_until="ongoing"
-        )
-
-        is_valid, error = Validator.validate_student_date_range(student)
-
-        self.assertTrue(is_valid)
-        self.assertIsNone(error)
-
-    def test_validate_student_date_range_invalid(self):
-        """Test invalid student date range (from > until)."""
-        student = Student(
-            id="s1",
-            name="Alice",
-            valid_from="2025-12-31",
-            valid_until="2025-01-01"
-        )
-
-        is_valid, error = Validator.validate_student_date_range(student)
-
-        self.assertFalse(is_valid)
-        self.assertIn("valid_from", error)
-        self.assertIn("valid_until", error)
-
-    def test_validate_student_date_range_same_date(self):
-        """Test student with same start and end date (valid)."""
-        student = Student(
-            id="s1",
-            name="Alice",
-            valid_from="2025-06-01",
-            valid_until="2025-06-01"
-        )
+    def test_validate_student_date_range(self):
+        """Test student date range validation."""
+        cases = [
+            # (description, valid_from, valid_until, expected valid)
+            ("valid", "2025-01-01", "2025-12-31", True),
+            ("ongoing", "2025-01-01", "ongoing", True),
+            ("from after until", "2025-12-31", "2025-01-01", False),
+            ("same date", "2025-06-01", "2025-06-01", True),
+            ("no zero padding", "2025-1-5", "2025-12-31", True),
+        ]
+        for description, valid_from, valid_until, expected in cases:
+            with self.subTest(description):
+                student = Student(id="s1", name="Alice", valid_from=valid_from, valid_until=valid_until)
 
-        is_valid, error = Validator.validate_student_date_range(student)
+                is_valid, error = Validator.validate_student_date_range(student)
 
-        self.assertTrue(is_valid)
-        self.assertIsNone(error)
+                self.assertEqual(is_valid, expected)
+                if expected:
+                    self.assertIsNone(error)
+                else:
+                    self.assertIn("valid_from", error)
+                    self.assertIn("valid_until", error)
 
     def test_validate_student_date_range_invalid_format(self):
         """Test student with invalid date format."""
@@ -293,9 +245,7 @@ class TestValidator(unittest.TestCase):
 
     def test_validate_all_seats_in_rooms_valid(self):
         """Test validation of all seats within rooms."""
-        rooms = [
-            Room(id="room_001", name="Room A", x=0, y=0, width=100, height=100, color="#1e3a5f"),
-        ]
+        rooms = [self.room_a]
         seats = [
             Seat(id="seat_001", room_id="room_001", number=1, x=10, y=10),
             Seat(id="seat_002", room_id="room_001", number=2, x=20, y=20),
@@ -308,9 +258,7 @@ class TestValidator(unittest.TestCase):
 
     def test_validate_all_seats_in_rooms_invalid(self):
         """Test validation with seats outside room bounds."""
-        rooms = [
-            Room(id="room_001", name="Room A", x=0, y=0, width=100, height=100, color="#1e3a5f"),
-        ]
+        rooms = [self.room_a]
         seats = [
             Seat(id="seat_001", room_id="room_001", number=1, x=10, y=10),
             Seat(id="seat_002", room_id="room_001", number=2, x=200, y=200),
@@ -324,9 +272,7 @@ class TestValidator(unittest.TestCase):
 
     def test_validate_all_seats_in_rooms_missing_room(self):
         """Test validation with seat referencing non-existent room."""
-        rooms = [
-            Room(id="room_001", name="Room A", x=0, y=0, width=100, height=100, color="#1e3a5f"),
-        ]
+        rooms = [self.room_a]
         seats = [
             Seat(id="seat_001", room_id="room_999", number=1, x=10, y=10),
         ]